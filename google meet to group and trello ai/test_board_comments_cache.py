@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test board-level comment caching in web_app
+
+Checks that board comments are revalidated with ETag/If-None-Match, and that a
+board with more comments than one page holds goes straight to the per-card path
+on a 304 instead of downloading the full page again.
+"""
+
+import os
+import sys
+
+# web_app configures Google OAuth at import time
+os.environ.setdefault('GOOGLE_CLIENT_ID', 'test-client-id')
+os.environ.setdefault('GOOGLE_CLIENT_SECRET', 'test-client-secret')
+
+import web_app
+
+BOARD_ID = 'board-test'
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+    def __init__(self, status_code, actions=None, etag=None):
+        self.status_code = status_code
+        self.content = web_app.json_dumps(actions or [])
+        self.headers = {'ETag': etag} if etag else {}
+
+class FakeHttp:
+    """Replays queued responses and records the If-None-Match header of each call."""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_etags = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_etags.append((headers or {}).get('If-None-Match'))
+        return self.responses.pop(0)
+
+def comment_action(card_id):
+    return {'type': 'commentCard', 'data': {'card': {'id': card_id}, 'text': 'update'}}
+
+def run_with_http(fake_http, card_ids, chunked_result=None):
+    """Call _fetch_card_comments_from_board with Trello HTTP and the per-card path faked."""
+    original_http = web_app._http
+    original_chunked = web_app._fetch_card_comments_chunked
+    chunked_calls = []
+
+    def fake_chunked(ids):
+        chunked_calls.append(list(ids))
+        return chunked_result or [[] for _ in ids]
+
+    web_app._http = fake_http
+    web_app._fetch_card_comments_chunked = fake_chunked
+    try:
+        return web_app._fetch_card_comments_from_board(BOARD_ID, card_ids), chunked_calls
+    finally:
+        web_app._http = original_http
+        web_app._fetch_card_comments_chunked = original_chunked
+
+def test_small_board_revalidates_with_etag():
+    """An unchanged board is served from cache on 304."""
+    web_app._board_comments_cache.clear()
+    actions = [comment_action('card-1'), comment_action('card-1'), comment_action('card-2')]
+    fake_http = FakeHttp(FakeResponse(200, actions, etag='"v1"'), FakeResponse(304))
+
+    first, chunked_first = run_with_http(fake_http, ['card-1', 'card-2'])
+    second, chunked_second = run_with_http(fake_http, ['card-1', 'card-2'])
+
+    assert fake_http.sent_etags == [None, '"v1"']
+    assert [len(comments) for comments in first] == [2, 1]
+    assert second == first
+    assert not chunked_first and not chunked_second
+    print("[PASS] - Small board revalidated with ETag")
+
+def test_oversized_board_skips_download_on_304():
+    """A board over the page limit caches its ETag and falls back per card without a new download."""
+    web_app._board_comments_cache.clear()
+    actions = [comment_action(f'card-{i}') for i in range(web_app.TRELLO_BOARD_ACTIONS_LIMIT)]
+    fake_http = FakeHttp(FakeResponse(200, actions, etag='"big"'), FakeResponse(304))
+    per_card = [['from-card-1'], ['from-card-2']]
+
+    first, chunked_first = run_with_http(fake_http, ['card-1', 'card-2'], per_card)
+    assert web_app._board_comments_cache[BOARD_ID] == ('"big"', None)
+    second, chunked_second = run_with_http(fake_http, ['card-1', 'card-2'], per_card)
+
+    assert fake_http.sent_etags == [None, '"big"']
+    assert first == per_card and second == per_card
+    assert chunked_first == [['card-1', 'card-2']]
+    assert chunked_second == [['card-1', 'card-2']]
+    print("[PASS] - Oversized board went straight to per-card fetch on 304")
+
+if __name__ == "__main__":
+    print("Board Comments Cache Test")
+    print("=" * 40)
+    try:
+        test_small_board_revalidates_with_etag()
+        test_oversized_board_skips_download_on_304()
+    except AssertionError as e:
+        print(f"[FAIL] - {e}")
+        sys.exit(1)
+    print("\nAll board comments cache tests passed")
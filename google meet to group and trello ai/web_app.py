@@ -4,12 +4,20 @@ Complete Web App - With Google Docs reading and Trello commenting
 """
 
 import asyncio
+import atexit
 import sys
 import os
 import re
 import json
 import time
-from datetime import datetime, timedelta
+import logging
+import threading
+import zlib
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
 from threading import Thread
 import schedule
@@ -17,10 +25,13 @@ import schedule
 # Add src to path
 sys.path.insert(0, 'src')
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask import Flask, render_template, request, jsonify, redirect, url_for, session, g, has_app_context
+from flask.json.provider import DefaultJSONProvider
 from dotenv import load_dotenv
 import requests
-from custom_trello import CustomTrelloClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from custom_trello import CustomTrelloClient, TrelloBoard
 from message_tracker import MessageTracker
 from gmail_tracker import GmailTracker, GmailScheduler, initialize_gmail_tracker
 from gmail_oauth import gmail_oauth
@@ -52,14 +63,88 @@ except ImportError as e:
     print(f"Warning: Could not import database module: {e}")
     DatabaseManager = None
 
+# Optional faster JSON encoder/decoder - falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_dumps(obj):
+    """Serialize obj to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def json_loads(data):
+    """Parse JSON text or bytes (e.g. a response body), using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson, keeping Flask's output conventions.
+    
+    Keys stay sorted and dates/dataclasses/UUIDs still go through Flask's default
+    hook. Indented (debug) output, and anything orjson can't encode, falls back
+    to the stdlib encoder.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        if orjson is not None and kwargs.get('indent') is None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
 # Load environment
 load_dotenv()
 
+# Emoji and card names in print/log output must not raise on consoles that can't
+# encode them (Windows cp1252), so callers never need ASCII-safe copies of text
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(errors='backslashreplace')
+
+# Module logger - set LOG_LEVEL=DEBUG to see per-card diagnostics
+log = logging.getLogger(__name__)
+log.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+if not log.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(_log_handler)
+    log.propagate = False
+
+# Shared HTTP session so Trello and Green API calls reuse pooled connections.
+# Rate-limit and gateway errors are retried for idempotent requests only (not POSTs).
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=32,
+                                    max_retries=Retry(total=2, backoff_factor=0.3,
+                                                      status_forcelist=(429, 500, 502, 503, 504),
+                                                      raise_on_status=False)))
+
+# API credentials, resolved once at startup
+TRELLO_API_KEY = os.environ.get('TRELLO_API_KEY')
+TRELLO_TOKEN = os.environ.get('TRELLO_TOKEN')
+GREEN_API_INSTANCE = os.environ.get('GREEN_API_INSTANCE')
+GREEN_API_TOKEN = os.environ.get('GREEN_API_TOKEN')
+GREEN_API_URL = (f"https://api.green-api.com/waInstance{GREEN_API_INSTANCE}/sendMessage/{GREEN_API_TOKEN}"
+                 if GREEN_API_INSTANCE and GREEN_API_TOKEN else None)
+
 # Initialize production database
 production_db = get_production_db()
 
 # Reminder Tracking System
 REMINDER_TRACKING_FILE = 'reminder_tracking.json'
+# Reminders are sent from worker threads, so file updates must not interleave
+_reminder_tracking_lock = threading.Lock()
 
 def load_reminder_tracking():
     """Load reminder tracking data from JSON file."""
@@ -79,36 +164,45 @@ def save_reminder_tracking(data):
     except Exception as e:
         print(f"Error saving reminder tracking: {e}")
 
+def increment_reminder_counts(card_ids, assigned_user):
+    """Increment reminder counts for several cards of one user with a single file write."""
+    with _reminder_tracking_lock:
+        tracking_data = load_reminder_tracking()
+        updated = {}
+        
+        for card_id in card_ids:
+            key = f"{card_id}_{assigned_user}"
+            
+            if key not in tracking_data:
+                tracking_data[key] = {
+                    'card_id': card_id,
+                    'assigned_user': assigned_user,
+                    'reminder_count': 0,
+                    'first_reminder_date': datetime.now().isoformat(),
+                    'last_reminder_date': None,
+                    'status': 'active',
+                    'escalated': False
+                }
+            
+            tracking_data[key]['reminder_count'] += 1
+            tracking_data[key]['last_reminder_date'] = datetime.now().isoformat()
+            
+            # Mark as escalated if 3+ reminders
+            if tracking_data[key]['reminder_count'] >= 3:
+                tracking_data[key]['status'] = 'escalated'
+                tracking_data[key]['escalated'] = True
+            
+            updated[card_id] = tracking_data[key]
+        
+        save_reminder_tracking(tracking_data)
+        return updated
+
 def increment_reminder_count(card_id, assigned_user):
     """Increment reminder count for a card and user."""
-    tracking_data = load_reminder_tracking()
-    key = f"{card_id}_{assigned_user}"
-    
-    if key not in tracking_data:
-        tracking_data[key] = {
-            'card_id': card_id,
-            'assigned_user': assigned_user,
-            'reminder_count': 0,
-            'first_reminder_date': datetime.now().isoformat(),
-            'last_reminder_date': None,
-            'status': 'active',
-            'escalated': False
-        }
-    
-    tracking_data[key]['reminder_count'] += 1
-    tracking_data[key]['last_reminder_date'] = datetime.now().isoformat()
-    
-    # Mark as escalated if 3+ reminders
-    if tracking_data[key]['reminder_count'] >= 3:
-        tracking_data[key]['status'] = 'escalated'
-        tracking_data[key]['escalated'] = True
-    
-    save_reminder_tracking(tracking_data)
-    return tracking_data[key]
+    return increment_reminder_counts([card_id], assigned_user)[card_id]
 
-def get_reminder_status(card_id, assigned_user):
-    """Get reminder status for a card and user."""
-    tracking_data = load_reminder_tracking()
+def reminder_status_from(tracking_data, card_id, assigned_user):
+    """Look up reminder status in already-loaded tracking data."""
     key = f"{card_id}_{assigned_user}"
     return tracking_data.get(key, {
         'reminder_count': 0,
@@ -116,17 +210,23 @@ def get_reminder_status(card_id, assigned_user):
         'status': 'new'
     })
 
+def get_reminder_status(card_id, assigned_user):
+    """Get reminder status for a card and user."""
+    return reminder_status_from(load_reminder_tracking(), card_id, assigned_user)
+
 def mark_card_resolved(card_id, assigned_user):
     """Mark a card as resolved (user finally updated)."""
-    tracking_data = load_reminder_tracking()
-    key = f"{card_id}_{assigned_user}"
-    
-    if key in tracking_data:
-        tracking_data[key]['status'] = 'resolved'
-        tracking_data[key]['resolved_date'] = datetime.now().isoformat()
-        save_reminder_tracking(tracking_data)
+    with _reminder_tracking_lock:
+        tracking_data = load_reminder_tracking()
+        key = f"{card_id}_{assigned_user}"
+        
+        if key in tracking_data:
+            tracking_data[key]['status'] = 'resolved'
+            tracking_data[key]['resolved_date'] = datetime.now().isoformat()
+            save_reminder_tracking(tracking_data)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 
 # Register blueprints
@@ -153,10 +253,10 @@ gmail_scheduler = None
 # Production initialization will happen at the end of the file
 
 # Enhanced Security Authentication System
-from functools import wraps
+from functools import lru_cache, partial, wraps
 import bcrypt
 import hashlib
-from collections import defaultdict
+from cachetools import TTLCache
 
 # Secure session configuration
 app.config.update(
@@ -173,24 +273,26 @@ LOGIN_PASSWORD_RAW = os.environ.get('LOGIN_PASSWORD', '2Talon3Gemm4')
 # Generate secure password hash (do this once)
 LOGIN_PASSWORD_HASH = bcrypt.hashpw(LOGIN_PASSWORD_RAW.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
+# Precomputed hash for constant-time dummy checks when verification errors out
+_DUMMY_HASH = bcrypt.hashpw(b'dummy-password', bcrypt.gensalt())
+
 # Rate limiting for brute force protection
-login_attempts = defaultdict(list)
 MAX_LOGIN_ATTEMPTS = 5
 LOCKOUT_DURATION = 300  # 5 minutes
 
+# Failed attempt counts per IP - bounded, and entries expire after LOCKOUT_DURATION
+login_attempts = TTLCache(maxsize=10000, ttl=LOCKOUT_DURATION)
+login_attempts_lock = threading.Lock()
+
 def is_rate_limited(ip_address):
     """Check if IP is rate limited."""
-    now = time.time()
-    attempts = login_attempts[ip_address]
-    
-    # Remove old attempts
-    login_attempts[ip_address] = [attempt for attempt in attempts if now - attempt < LOCKOUT_DURATION]
-    
-    return len(login_attempts[ip_address]) >= MAX_LOGIN_ATTEMPTS
+    with login_attempts_lock:
+        return login_attempts.get(ip_address, 0) >= MAX_LOGIN_ATTEMPTS
 
 def record_failed_attempt(ip_address):
     """Record failed login attempt."""
-    login_attempts[ip_address].append(time.time())
+    with login_attempts_lock:
+        login_attempts[ip_address] = login_attempts.get(ip_address, 0) + 1
 
 def verify_password(provided_password, stored_hash):
     """Securely verify password using bcrypt with timing attack protection."""
@@ -198,8 +300,8 @@ def verify_password(provided_password, stored_hash):
         # Always perform hashing to prevent timing attacks
         return bcrypt.checkpw(provided_password.encode('utf-8'), stored_hash.encode('utf-8'))
     except Exception:
-        # Timing attack protection - still do some work
-        bcrypt.hashpw(b'dummy', bcrypt.gensalt())
+        # Timing attack protection - still do the same bcrypt work
+        bcrypt.checkpw(b'dummy', _DUMMY_HASH)
         return False
 
 def login_required(f):
@@ -231,6 +333,11 @@ try:
 except Exception as e:
     print(f"[V3] Warning: Could not initialize V3 database tables: {e}")
 
+# Processed transcripts kept in memory for follow-up actions (oldest dropped first);
+# long texts in them are cut to a preview
+SPEAKER_ANALYSES_HISTORY = 50
+HISTORY_TEXT_PREVIEW_CHARS = 2048
+
 # Global data storage
 app_data = {
     'cards_needing_updates': [],
@@ -241,16 +348,24 @@ app_data = {
         'schedule_time': '09:00',
         'schedule_days': ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
     },
-    'speaker_analyses': [],
+    'speaker_analyses': deque(maxlen=SPEAKER_ANALYSES_HISTORY),
     'recurring_tasks': []
 }
 
+# Scan results in app_data are replaced by scans while request handlers read them
+_app_data_lock = threading.RLock()
+
+def get_cards_snapshot(key='cards_needing_updates'):
+    """Return a copy of a stored scan result list, safe to use without the lock."""
+    with _app_data_lock:
+        return list(app_data.get(key, []))
+
 # Initialize Trello client
 trello_client = None
 try:
     trello_client = CustomTrelloClient(
-        api_key=os.environ.get('TRELLO_API_KEY'),
-        token=os.environ.get('TRELLO_TOKEN')
+        api_key=TRELLO_API_KEY,
+        token=TRELLO_TOKEN
     )
     print("Custom Trello client initialized successfully")
 except Exception as e:
@@ -285,8 +400,8 @@ def login():
         
         if username_valid and password_valid:
             # Clear any previous failed attempts
-            if client_ip in login_attempts:
-                del login_attempts[client_ip]
+            with login_attempts_lock:
+                login_attempts.pop(client_ip, None)
             
             # Create secure session
             session.permanent = True
@@ -344,7 +459,7 @@ def team_tracker_app():
 def legacy_team_tracker_app():
     """Legacy team tracker page"""
     return render_template('team_tracker.html', 
-                         cards=app_data['cards_needing_updates'],
+                         cards=get_cards_snapshot(),
                          team_members=TEAM_MEMBERS,
                          settings=app_data['settings'])
 
@@ -499,68 +614,68 @@ def upload_csv_rules():
 
 # ===== AUTOMATED SCHEDULER =====
 
-import threading
-import time
-from datetime import datetime, timedelta
+# Set this event to stop the automated scanner loop (e.g. on shutdown)
+scheduler_stop = threading.Event()
+# Dedicated scheduler so other modules' jobs don't share our run loop
+_auto_scheduler = schedule.Scheduler()
 
 def reset_reminder_count(card_id, assigned_user):
     """Reset reminder count when user comments on card."""
-    tracking_data = load_reminder_tracking()
-    key = f"{card_id}_{assigned_user}"
-    
-    if key in tracking_data:
-        tracking_data[key]['reminder_count'] = 0
-        tracking_data[key]['escalated'] = False
-        tracking_data[key]['status'] = 'active'
-        tracking_data[key]['last_comment_date'] = datetime.now().isoformat()
-        save_reminder_tracking(tracking_data)
-        print(f"Reset reminder count for {assigned_user} on card {card_id}")
-        return tracking_data[key]
-    
-    return None
+    with _reminder_tracking_lock:
+        tracking_data = load_reminder_tracking()
+        key = f"{card_id}_{assigned_user}"
+        
+        if key in tracking_data:
+            tracking_data[key]['reminder_count'] = 0
+            tracking_data[key]['escalated'] = False
+            tracking_data[key]['status'] = 'active'
+            tracking_data[key]['last_comment_date'] = datetime.now().isoformat()
+            save_reminder_tracking(tracking_data)
+            log.info("Reset reminder count for %s on card %s", assigned_user, card_id)
+            return tracking_data[key]
+        
+        return None
+
+def run_scheduled_scan():
+    """Scheduled job: run the daily scan and report the next run time."""
+    log.info("[AUTO] AUTOMATED SCAN: Starting daily team tracker scan...")
+    perform_automated_scan()
+    log.info("[AUTO] Next automated scan scheduled for: %s", _auto_scheduler.next_run)
 
 def automated_daily_scan():
     """Automated daily scanner that runs in background thread."""
-    while True:
+    _auto_scheduler.clear()
+    _auto_scheduler.every().day.at("09:00").do(run_scheduled_scan)
+    log.info("[AUTO] Next automated scan scheduled for: %s", _auto_scheduler.next_run)
+    
+    # Wake up every minute to run due jobs; returns as soon as scheduler_stop is set
+    while not scheduler_stop.wait(60):
         try:
-            # Wait for next scan time (check every 6 hours, scan at 9 AM)
-            now = datetime.now()
-            target_time = now.replace(hour=9, minute=0, second=0, microsecond=0)
-            
-            # If it's past 9 AM today, schedule for tomorrow
-            if now.time() > target_time.time():
-                target_time += timedelta(days=1)
-            
-            sleep_seconds = (target_time - now).total_seconds()
-            print(f"[AUTO] Next automated scan scheduled for: {target_time}")
-            time.sleep(sleep_seconds)
-            
-            # Perform automated scan
-            print("[AUTO] AUTOMATED SCAN: Starting daily team tracker scan...")
-            perform_automated_scan()
-            
+            _auto_scheduler.run_pending()
         except Exception as e:
-            print(f"Error in automated scanner: {e}")
-            time.sleep(3600)  # Wait 1 hour before retrying
+            log.error("Error in automated scanner: %s", e)
 
 def perform_automated_scan():
     """Perform the actual automated scan and send reminders."""
     try:
+        # The scheduler thread runs outside any request, so start from fresh card data here
+        reset_card_lookup_cache()
+        
         # Scan for overdue cards
         scan_result = scan_trello_cards_for_updates()
         if not scan_result.get('success'):
-            print(f"Automated scan failed: {scan_result.get('error')}")
+            log.warning("Automated scan failed: %s", scan_result.get('error'))
             return
         
         overdue_cards = scan_result.get('cards_needing_updates', [])
         if not overdue_cards:
-            print("[AUTO] No overdue cards found in automated scan.")
+            log.info("[AUTO] No overdue cards found in automated scan.")
             return
         
-        print(f"[AUTO] Found {len(overdue_cards)} overdue cards in automated scan.")
+        log.info("[AUTO] Found %s overdue cards in automated scan.", len(overdue_cards))
         
         # Group cards by user
-        user_cards = {}
+        user_cards = defaultdict(list)
         for card in overdue_cards:
             assigned_user = card.get('assigned_user')
             assigned_whatsapp = card.get('assigned_whatsapp')
@@ -568,12 +683,14 @@ def perform_automated_scan():
             if not assigned_user or not assigned_whatsapp:
                 continue
             
-            if assigned_user not in user_cards:
-                user_cards[assigned_user] = []
             user_cards[assigned_user].append(card)
         
         # Send reminders and check for escalations
         group_escalations = []
+        reminders_to_send = []
+        
+        # Read reminder tracking once for the whole scan instead of once per card
+        tracking = load_reminder_tracking()
         
         for assigned_user, cards in user_cards.items():
             # Check if any cards need escalation
@@ -581,7 +698,7 @@ def perform_automated_scan():
             regular_cards = []
             
             for card in cards:
-                reminder_status = get_reminder_status(card['id'], assigned_user)
+                reminder_status = reminder_status_from(tracking, card['id'], assigned_user)
                 if reminder_status['escalated'] or reminder_status['reminder_count'] >= 3:
                     escalated_cards.append(card)
                     group_escalations.append({
@@ -594,35 +711,50 @@ def perform_automated_scan():
                 else:
                     regular_cards.append(card)
             
-            # Send regular reminders for non-escalated cards
+            # Queue regular reminders for non-escalated cards
             if regular_cards:
-                send_automated_reminder(assigned_user, regular_cards)
+                reminders_to_send.append((assigned_user, regular_cards))
+        
+        # Each reminder is an independent Green API round-trip, so send them concurrently
+        if reminders_to_send:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(send_automated_reminder, assigned_user, cards, tracking)
+                           for assigned_user, cards in reminders_to_send]
+                for future in as_completed(futures):
+                    future.result()
         
         # Send group escalation if needed
         if group_escalations:
             send_group_escalation(group_escalations)
         
     except Exception as e:
-        print(f"Error in automated scan: {e}")
+        log.error("Error in automated scan: %s", e)
 
-def send_automated_reminder(assigned_user, cards):
-    """Send automated reminder to user."""
+def send_automated_reminder(assigned_user, cards, tracking=None):
+    """Send automated reminder to user.
+    
+    tracking is the reminder tracking data already loaded by the caller, if any.
+    """
     try:
         whatsapp_number = TEAM_MEMBERS.get(assigned_user)
         if not whatsapp_number:
-            print(f"[AUTO] No WhatsApp number for {assigned_user}")
+            log.warning("[AUTO] No WhatsApp number for %s", assigned_user)
             return
         
+        if tracking is None:
+            tracking = load_reminder_tracking()
+        
         # Create message
-        message = f"""🤖 AUTOMATED REMINDER: Hey {assigned_user}, these cards need updates (over 24 hours). Please comment with your progress or these will escalate to the main group after 3 reminders.
-
-📋 Cards requiring updates ({len(cards)}):
-
-"""
+        lines = [
+            f"🤖 AUTOMATED REMINDER: Hey {assigned_user}, these cards need updates (over 24 hours). Please comment with your progress or these will escalate to the main group after 3 reminders.",
+            "",
+            f"📋 Cards requiring updates ({len(cards)}):",
+            "",
+        ]
         
         for i, card in enumerate(cards, 1):
             hours = card.get('hours_since_assigned_update', 0)
-            reminder_status = get_reminder_status(card['id'], assigned_user)
+            reminder_status = reminder_status_from(tracking, card['id'], assigned_user)
             reminder_count = reminder_status['reminder_count']
             
             if hours > 72:
@@ -635,52 +767,52 @@ def send_automated_reminder(assigned_user, cards):
             days = int(hours / 24)
             reminder_text = f" (Reminder #{reminder_count + 1})" if reminder_count > 0 else ""
             
-            message += f"{urgency_icon} {i}. *{card['name']}*{reminder_text}\n"
-            message += f"   ⏰ {days} days without update\n"
-            message += f"   🔗 {card['url']}\n\n"
+            lines.append(f"{urgency_icon} {i}. *{card['name']}*{reminder_text}")
+            lines.append(f"   ⏰ {days} days without update")
+            lines.append(f"   🔗 {card['url']}")
+            lines.append("")
         
-        message += "Please update these cards with your current progress. Thanks! 🚀\n\n- JGV EEsystems Auto-Tracker"
+        lines.append("Please update these cards with your current progress. Thanks! 🚀")
+        lines.append("")
+        lines.append("- JGV EEsystems Auto-Tracker")
+        message = "\n".join(lines)
         
         # Send via Green API
-        green_api_instance = os.environ.get('GREEN_API_INSTANCE')
-        green_api_token = os.environ.get('GREEN_API_TOKEN')
-        
-        if not green_api_instance or not green_api_token:
-            print("[AUTO] Green API credentials not configured for automated reminders")
+        if not GREEN_API_URL:
+            log.warning("[AUTO] Green API credentials not configured for automated reminders")
             return
         
-        green_api_url = f"https://api.green-api.com/waInstance{green_api_instance}/sendMessage/{green_api_token}"
-        
         payload = {
             "chatId": whatsapp_number,
             "message": message
         }
         
-        response = requests.post(green_api_url, json=payload, timeout=30)
+        response = _http.post(GREEN_API_URL, json=payload, timeout=30)
         
         if response.status_code == 200:
-            # Increment reminder count for each card
+            # Increment reminder count for each card (one tracking file write)
+            updated = increment_reminder_counts([card['id'] for card in cards], assigned_user)
             for card in cards:
-                reminder_data = increment_reminder_count(card['id'], assigned_user)
-                print(f"[AUTO] Incremented reminder count for {assigned_user} on card {card['name']}: {reminder_data['reminder_count']}")
+                log.debug("[AUTO] Incremented reminder count for %s on card %s: %s", assigned_user, card['name'], updated[card['id']]['reminder_count'])
             
-            print(f"[AUTO] Sent reminder to {assigned_user} for {len(cards)} cards")
+            log.info("[AUTO] Sent reminder to %s for %s cards", assigned_user, len(cards))
         else:
-            print(f"[AUTO] Failed to send reminder to {assigned_user}: {response.status_code}")
+            log.warning("[AUTO] Failed to send reminder to %s: %s", assigned_user, response.status_code)
         
     except Exception as e:
-        print(f"Error sending automated reminder to {assigned_user}: {e}")
+        log.error("Error sending automated reminder to %s: %s", assigned_user, e)
 
 def send_group_escalation(escalated_cards):
     """Send escalation message to group chat."""
     try:
         group_chat_id = os.environ.get('WHATSAPP_GROUP_CHAT_ID', '120363401025025313@g.us')
         
-        escalation_message = """🚨 AUTOMATED ESCALATION: Cards Requiring Immediate Attention 🚨
-
-The following team members have not responded to 3+ reminders about their assigned cards:
-
-"""
+        lines = [
+            "🚨 AUTOMATED ESCALATION: Cards Requiring Immediate Attention 🚨",
+            "",
+            "The following team members have not responded to 3+ reminders about their assigned cards:",
+            "",
+        ]
         
         # Group by user
         escalated_by_user = {}
@@ -691,38 +823,38 @@ The following team members have not responded to 3+ reminders about their assign
             escalated_by_user[user].append(card)
         
         for user, user_cards in escalated_by_user.items():
-            escalation_message += f"\n👤 *{user}* ({len(user_cards)} cards):\n"
+            lines.append("")
+            lines.append(f"👤 *{user}* ({len(user_cards)} cards):")
             for card in user_cards:
                 days = int(card['hours_since_update'] / 24)
-                escalation_message += f"   🔴 {card['card_name']} ({days} days, {card['reminder_count']} reminders)\n"
-                escalation_message += f"       🔗 {card['card_url']}\n"
+                lines.append(f"   🔴 {card['card_name']} ({days} days, {card['reminder_count']} reminders)")
+                lines.append(f"       🔗 {card['card_url']}")
         
-        escalation_message += "\n⚠️ Please follow up with these team members immediately or reassign these cards.\n\n- JGV EEsystems Auto-Tracker"
+        lines.append("")
+        lines.append("⚠️ Please follow up with these team members immediately or reassign these cards.")
+        lines.append("")
+        lines.append("- JGV EEsystems Auto-Tracker")
+        escalation_message = "\n".join(lines)
         
         # Send to group
-        green_api_instance = os.environ.get('GREEN_API_INSTANCE')
-        green_api_token = os.environ.get('GREEN_API_TOKEN')
-        
-        if not green_api_instance or not green_api_token:
-            print("[AUTO] Green API credentials not configured for group escalation")
+        if not GREEN_API_URL:
+            log.warning("[AUTO] Green API credentials not configured for group escalation")
             return
         
-        green_api_url = f"https://api.green-api.com/waInstance{green_api_instance}/sendMessage/{green_api_token}"
-        
         payload = {
             "chatId": group_chat_id,
             "message": escalation_message
         }
         
-        response = requests.post(green_api_url, json=payload, timeout=30)
+        response = _http.post(GREEN_API_URL, json=payload, timeout=30)
         
         if response.status_code == 200:
-            print(f"[AUTO] Sent group escalation for {len(escalated_cards)} cards")
+            log.info("[AUTO] Sent group escalation for %s cards", len(escalated_cards))
         else:
-            print(f"[AUTO] Failed to send group escalation: {response.status_code}")
+            log.warning("[AUTO] Failed to send group escalation: %s", response.status_code)
         
     except Exception as e:
-        print(f"Error sending group escalation: {e}")
+        log.error("Error sending group escalation: %s", e)
 
 # Start automated scanner in background thread
 auto_scanner_thread = None
@@ -731,22 +863,93 @@ def start_automated_scanner():
     """Start the automated scanner thread."""
     global auto_scanner_thread
     if auto_scanner_thread is None or not auto_scanner_thread.is_alive():
+        scheduler_stop.clear()
         auto_scanner_thread = threading.Thread(target=automated_daily_scan, daemon=True)
         auto_scanner_thread.start()
-        print("[AUTO] Automated daily scanner started")
+        log.info("[AUTO] Automated daily scanner started")
+
+def stop_automated_scanner():
+    """Signal the automated scanner thread to exit."""
+    scheduler_stop.set()
+    log.info("[AUTO] Automated daily scanner stopping")
+
+# Let the scanner thread leave its wait instead of being killed mid-job at shutdown
+atexit.register(stop_automated_scanner)
 
 # ===== UTILITY FUNCTIONS =====
 
+_DOC_ID_RE = re.compile(r'/document/d/([a-zA-Z0-9_-]+)')
+# Any keyword that can open a section in extract_google_doc_content; lines without one skip the header checks
+_DOC_SECTION_HINT_RE = re.compile(
+    r'notes|transcript|trello board review|summary|key points|main points|highlights'
+    r'|decisions|resolved|agreed|action items|next steps|todo|objectives|goals|purpose'
+)
+# Section headers in priority order: (section, pattern on the lowercased line, label logged when found)
+_DOC_SECTION_PATTERNS = (
+    ('notes_tab_content', re.compile(r'^notes|notes:'), 'Notes tab'),
+    ('transcript_tab_content', re.compile(r'^transcript|transcript:'), 'Transcript tab'),
+    ('trello_board_review', re.compile(r'^(?=.*trello board review)(?=.*task assignments)'), 'Trello Board Review'),
+    ('meeting_summary', re.compile(r'summary'), None),
+    ('key_points', re.compile(r'key points|main points|highlights'), None),
+    ('decisions', re.compile(r'decisions|resolved|agreed'), None),
+    ('action_items', re.compile(r'action items|next steps|todo'), None),
+    ('objectives', re.compile(r'objectives|goals|purpose'), None),
+)
+
+# Meeting-analysis keyword scans over lowercased transcript lines
+_DISCUSSION_TRIGGER_RE = re.compile(r'discuss|talk about|review|look at')
+_DECISION_LINE_RE = re.compile(r'decided|agreed|resolved|concluded')
+_ACTION_LINE_RE = re.compile(r'will do|next step|follow up|action')
+_DECISION_LANGUAGE_RE = re.compile(r'decide|agree|resolve|conclude')
+# Union of the four scans above: a line it doesn't match can't match any of them
+_MEETING_KEYWORD_HINT_RE = re.compile(
+    r'decide|agree|resolve|conclude|will do|next step|follow up|action|discuss|talk about|review|look at'
+)
+# "Speaker Name: message" lines used to find participants
+_PARTICIPANT_LINE_RE = re.compile(r'^([A-Za-z][A-Za-z\s]+?):\s*(.+)$')
+# "<name> will/should/must ...", "<name> is going to ...", "<name> can take/handle ..." -> (assignee, task)
+_ACTION_ITEM_PATTERNS = (
+    re.compile(r'(\w+)\s+(?:will|should|must)\s+([^.!?]+)', re.IGNORECASE),
+    re.compile(r'(\w+)\s+is\s+going\s+to\s+([^.!?]+)', re.IGNORECASE),
+    re.compile(r'(\w+)\s+can\s+(?:take|handle)\s+([^.!?]+)', re.IGNORECASE),
+)
+# The verb phrases all three patterns need; a line without one can't match any of them
+_ACTION_ITEM_HINT_RE = re.compile(r'\s(?:will|should|must|is\s+going\s+to|can\s+(?:take|handle))\s', re.IGNORECASE)
+_CONTENT_INDICATOR_RE = re.compile(r'transcript|:|said|meeting|discussion', re.IGNORECASE)
+# Words reported when a transcript arrives; case-insensitive so the text isn't lowercased just to log
+_COMMON_WORD_PATTERNS = tuple((word.title(), re.compile(word, re.IGNORECASE))
+                              for word in ('mobile', 'app', 'center', 'court'))
+
+# Recent public Google Doc exports (doc_id -> validators + text), revalidated with conditional GETs
+DOC_EXPORT_CACHE_SIZE = 128
+_doc_export_cache = OrderedDict()
+_doc_export_cache_lock = threading.Lock()
+
+def get_cached_doc_export(doc_id):
+    """Return the cached export entry for a doc, or None."""
+    with _doc_export_cache_lock:
+        entry = _doc_export_cache.get(doc_id)
+        if entry is not None:
+            _doc_export_cache.move_to_end(doc_id)
+        return entry
+
+def cache_doc_export(doc_id, validators, text):
+    """Remember an export with its ETag/Last-Modified validators, evicting the oldest entries."""
+    with _doc_export_cache_lock:
+        _doc_export_cache[doc_id] = {'validators': validators, 'text': text}
+        _doc_export_cache.move_to_end(doc_id)
+        while len(_doc_export_cache) > DOC_EXPORT_CACHE_SIZE:
+            _doc_export_cache.popitem(last=False)
+
 def extract_google_doc_id(url):
     """Extract document ID from Google Docs URL."""
-    pattern = r'/document/d/([a-zA-Z0-9-_]+)'
-    match = re.search(pattern, url)
+    match = _DOC_ID_RE.search(url)
     return match.group(1) if match else None
 
 def get_google_doc_text(doc_id):
     """Extract text from Google Docs using proper Google Drive API authentication."""
     try:
-        print(f"Attempting to fetch Google Doc: {doc_id}")
+        log.info("Attempting to fetch Google Doc: %s", doc_id)
         
         # Try to use the Google Drive integration first (only if properly configured)
         google_client_id = os.getenv('GOOGLE_CLIENT_ID')
@@ -763,24 +966,18 @@ def get_google_doc_text(doc_id):
                 # Use the Google Drive API to get document content
                 text = drive_client.get_document_text(doc_id)
                 if text and text.strip():
-                    try:
-                        print(f"✅ Retrieved text from Google Drive API: {len(text)} chars")
-                    except UnicodeEncodeError:
-                        print(f"Retrieved text from Google Drive API: {len(text)} chars")
+                    log.info("✅ Retrieved text from Google Drive API: %s chars", len(text))
                     return text
                 else:
-                    print("Google Drive API returned empty content")
+                    log.warning("Google Drive API returned empty content")
                     
             except Exception as e:
-                try:
-                    print(f"❌ Google Drive API failed: {e}")
-                except UnicodeEncodeError:
-                    print(f"Google Drive API failed: [Unicode Error]")
+                log.warning("❌ Google Drive API failed: %s", e)
         else:
-            print("Google API credentials not configured, using fallback method only")
+            log.info("Google API credentials not configured, using fallback method only")
         
         # Fallback to public URL method (for publicly shared docs)
-        print("Trying fallback public URL method...")
+        log.debug("Trying fallback public URL method...")
         export_urls = [
             f"https://docs.google.com/document/d/{doc_id}/export?format=txt",
             f"https://docs.google.com/document/u/0/d/{doc_id}/export?format=txt"
@@ -788,120 +985,213 @@ def get_google_doc_text(doc_id):
         
         for i, url in enumerate(export_urls):
             try:
-                print(f"Trying fallback URL method {i+1}: {url}")
+                log.debug("Trying fallback URL method %s: %s", i+1, url)
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
-                response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-                print(f"Response status: {response.status_code}")
                 
-                if response.status_code == 200:
+                # Revalidate a previously exported copy instead of downloading it again
+                cached_export = get_cached_doc_export(doc_id)
+                if cached_export:
+                    headers.update(cached_export['validators'])
+                
+                with _http.get(url, headers=headers, timeout=15, allow_redirects=True, stream=True) as response:
+                    log.debug("Response status: %s", response.status_code)
+                    
+                    if response.status_code == 304 and cached_export:
+                        log.info("Google Doc unchanged since last export, using cached text")
+                        return cached_export['text']
+                    
+                    if response.status_code != 200:
+                        log.warning("Failed with status code: %s", response.status_code)
+                        continue
+                    
                     # Handle encoding properly
                     response.encoding = 'utf-8'  # Ensure proper UTF-8 encoding
-                    text = response.text
-                    print(f"Retrieved text length: {len(text)}")
                     
-                    # Clean text of problematic characters for Windows console
-                    try:
-                        # Test if text can be printed safely
-                        safe_text_sample = text[:200].encode('ascii', errors='replace').decode('ascii')
-                        print(f"Sample content: {safe_text_sample}...")
-                    except:
-                        print("Content contains special characters (safe processing)")
+                    # Stream the export and look for transcript indicators chunk by chunk,
+                    # instead of lowercasing the whole document once per indicator
+                    chunks = []
+                    has_indicator = False
+                    for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+                        chunks.append(chunk)
+                        if not has_indicator and _CONTENT_INDICATOR_RE.search(chunk):
+                            has_indicator = True
+                    text = ''.join(chunks)
                     
-                    # Check if it's actual content
-                    if len(text) > 50 and not text.startswith('<!DOCTYPE'):
-                        content_indicators = ['transcript', ':', 'said', 'meeting', 'discussion']
-                        
-                        if any(indicator.lower() in text.lower() for indicator in content_indicators) or len(text) > 200:
-                            print("Valid transcript content detected via fallback")
-                            return text
-                        else:
-                            print("Text found but doesn't appear to be transcript content")
+                    validators = {}
+                    if response.headers.get('ETag'):
+                        validators['If-None-Match'] = response.headers['ETag']
+                    if response.headers.get('Last-Modified'):
+                        validators['If-Modified-Since'] = response.headers['Last-Modified']
+                
+                log.debug("Retrieved text length: %s", len(text))
+                
+                log.debug("Sample content: %s...", text[:200])
+                
+                # Check if it's actual content
+                if len(text) > 50 and not text.startswith('<!DOCTYPE'):
+                    if has_indicator or len(text) > 200:
+                        log.info("Valid transcript content detected via fallback")
+                        if validators:
+                            cache_doc_export(doc_id, validators, text)
+                        return text
                     else:
-                        print("Response appears to be HTML error page or too short")
+                        log.warning("Text found but doesn't appear to be transcript content")
                 else:
-                    print(f"Failed with status code: {response.status_code}")
+                    log.warning("Response appears to be HTML error page or too short")
                     
             except requests.exceptions.Timeout:
-                print(f"Timeout on method {i+1}")
+                log.warning("Timeout on method %s", i+1)
                 continue
             except Exception as e:
-                print(f"Error on method {i+1}: {e}")
+                log.warning("Error on method %s: %s", i+1, e)
                 continue
         
-        print("All methods failed")
+        log.warning("All methods failed")
         return None
         
     except Exception as e:
-        # Safe print to handle Unicode characters in error messages
-        try:
-            print(f"Critical error fetching Google Doc: {e}")
-        except UnicodeEncodeError:
-            print(f"Critical error fetching Google Doc: [Unicode Error - Document may contain special characters]")
+        log.error("Critical error fetching Google Doc: %s", e)
+        return None
+
+# ===== TRELLO BOARD CACHE =====
+
+# Board, card and board-member lookups are reused for this many seconds
+TRELLO_CACHE_TTL = 60
+_trello_cache = {}  # key -> (value, expires_at)
+_trello_cache_lock = threading.Lock()
+
+def _trello_cache_get(key):
+    with _trello_cache_lock:
+        entry = _trello_cache.get(key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        _trello_cache.pop(key, None)
         return None
 
+def _trello_cache_set(key, value):
+    with _trello_cache_lock:
+        _trello_cache[key] = (value, time.monotonic() + TRELLO_CACHE_TTL)
+
+def invalidate_trello_cache():
+    """Drop cached boards, cards and board members (e.g. after a Trello API error)."""
+    with _trello_cache_lock:
+        _trello_cache.clear()
+
+def _get_eeinteractive_board():
+    """Return the open EEInteractive board, cached for TRELLO_CACHE_TTL seconds."""
+    board = _trello_cache_get('eeinteractive_board')
+    if board is not None or not trello_client:
+        return board
+    
+    board = next((b for b in trello_client.list_boards()
+                  if not b.closed and 'eeinteractive' in b.name.lower()), None)
+    
+    if board:
+        _trello_cache_set('eeinteractive_board', board)
+    return board
+
+def _get_fresh_eeinteractive_board():
+    """Return a new EEInteractive board object, or None.
+    
+    Only the board lookup is cached. The cached object memoizes its cards and
+    lists (including an empty result after an API error), so routes that report
+    the board's current state load them through a fresh object instead.
+    """
+    board = _get_eeinteractive_board()
+    if not board:
+        return None
+    return TrelloBoard({'id': board.id, 'name': board.name, 'closed': board.closed},
+                       board.api_key, board.token)
+
+def _get_eeinteractive_cards():
+    """Return the EEInteractive board's cards.
+    
+    The cached board object keeps its own card list, so cards expire with the
+    board. An empty result (board missing or API error) is not cached.
+    """
+    board = _get_eeinteractive_board()
+    if not board:
+        return []
+    
+    cards = board.list_cards()
+    if not cards:
+        invalidate_trello_cache()
+    return cards
+
 # ===== ENHANCED ASSIGNMENT DETECTION SYSTEM =====
 
 def get_board_members_mapping():
     """Get all board members and create mapping to team members - using same board detection as scan_cards."""
     try:
-        api_key = os.environ.get('TRELLO_API_KEY')
-        token = os.environ.get('TRELLO_TOKEN')
-        
-        if not api_key or not token:
-            print("  BOARD_MEMBERS: Missing Trello API credentials")
+        if not TRELLO_API_KEY or not TRELLO_TOKEN:
+            log.warning("  BOARD_MEMBERS: Missing Trello API credentials")
             return {}
         
         if not trello_client:
-            print("  BOARD_MEMBERS: Trello client not available")
+            log.warning("  BOARD_MEMBERS: Trello client not available")
             return {}
         
-        # Use SAME board detection logic as scan_cards function
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
+        # Matching depends on the current team list, so key the cache on it
+        cache_key = ('board_members', tuple(TEAM_MEMBERS.items()))
+        cached_mapping = _trello_cache_get(cache_key)
+        if cached_mapping is not None:
+            return cached_mapping
         
-        for board in boards:
-            if board.closed:
-                continue
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        # Use SAME board detection logic as scan_cards function
+        eeinteractive_board = _get_eeinteractive_board()
         
         if not eeinteractive_board:
-            print("  BOARD_MEMBERS: EEInteractive board not found")
+            log.warning("  BOARD_MEMBERS: EEInteractive board not found")
             return {}
         
         board_id = eeinteractive_board.id
-        print(f"  BOARD_MEMBERS: Using board '{eeinteractive_board.name}' (ID: {board_id})")
+        log.debug("  BOARD_MEMBERS: Using board '%s' (ID: %s)", eeinteractive_board.name, board_id)
         
         # Get board members
         url = f"https://api.trello.com/1/boards/{board_id}/members"
         params = {
-            'key': api_key,
-            'token': token,
+            'key': TRELLO_API_KEY,
+            'token': TRELLO_TOKEN,
             'fields': 'id,fullName,username'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http.get(url, params=params, timeout=10)
         if response.status_code != 200:
-            print(f"  BOARD_MEMBERS: API error {response.status_code}")
+            log.warning("  BOARD_MEMBERS: API error %s", response.status_code)
+            invalidate_trello_cache()
             return {}
         
-        board_members = response.json()
-        print(f"  BOARD_MEMBERS: Found {len(board_members)} board members")
+        board_members = json_loads(response.content)
+        log.debug("  BOARD_MEMBERS: Found %s board members", len(board_members))
         member_mapping = {}
         
         # Debug: Show all board members and team members
-        print(f"  BOARD_MEMBERS: Available board members:")
-        for member in board_members:
-            member_name = member.get('fullName', '').strip()
-            member_id = member.get('id', '')
-            print(f"    - {member_name} (ID: {member_id})")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("  BOARD_MEMBERS: Available board members:")
+            for member in board_members:
+                log.debug("    - %s (ID: %s)", member.get('fullName', '').strip(), member.get('id', ''))
+            
+            log.debug("  BOARD_MEMBERS: Team members to match:")
+            for team_name, whatsapp in TEAM_MEMBERS.items():
+                log.debug("    - %s -> %s", team_name, whatsapp)
         
-        print(f"  BOARD_MEMBERS: Team members to match:")
+        # Lowercased names, variations and words per team member, built once for all board members
+        team_table = []
         for team_name, whatsapp in TEAM_MEMBERS.items():
-            print(f"    - {team_name} -> {whatsapp}")
+            team_lower = team_name.lower()
+            
+            # Enhanced fuzzy matching with variations and word-based matching
+            name_variations = [
+                team_lower,
+                team_lower.replace('ey', 'y'),  # Lancey -> Lancy
+                team_lower.replace('y', 'ey'),  # Lancy -> Lancey
+                team_lower.replace(' ', ''),    # Remove spaces
+            ]
+            variation_parts = [(variation, [part for part in variation.split() if len(part) > 2])
+                               for variation in name_variations]
+            team_table.append((team_name, whatsapp, variation_parts, team_lower.split()))
         
         # Create mapping from Trello member ID to team member info
         for member in board_members:
@@ -910,45 +1200,34 @@ def get_board_members_mapping():
             
             if not member_name or not member_id:
                 continue
+            
+            member_lower = member_name.lower()
+            member_words = member_lower.split()
                 
             # Match to our team members with name variations
             matched = False
-            for team_name, whatsapp in TEAM_MEMBERS.items():
+            for team_name, whatsapp, variation_parts, team_words in team_table:
                 if matched:
                     break
-                    
-                team_lower = team_name.lower()
-                member_lower = member_name.lower()
                 
-                # Enhanced fuzzy matching with variations and word-based matching
-                name_variations = [
-                    team_lower,
-                    team_lower.replace('ey', 'y'),  # Lancey -> Lancy
-                    team_lower.replace('y', 'ey'),  # Lancy -> Lancey
-                    team_lower.replace(' ', ''),    # Remove spaces
-                ]
-                
-                print(f"  BOARD_MEMBERS: Checking '{member_name}' vs '{team_name}'")
+                log.debug("  BOARD_MEMBERS: Checking '%s' vs '%s'", member_name, team_name)
                 
                 # Method 1: Direct variations matching
-                for variation in name_variations:
+                for variation, parts in variation_parts:
                     if (variation in member_lower or 
                         member_lower in variation or
-                        any(part in member_lower for part in variation.split() if len(part) > 2)):
+                        any(part in member_lower for part in parts)):
                         member_mapping[member_id] = {
                             'team_name': team_name,
                             'trello_name': member_name,
                             'whatsapp': whatsapp
                         }
-                        print(f"  BOARD_MEMBERS: ✅ MATCHED {member_name} ({member_id}) -> {team_name} (direct)")
+                        log.debug("  BOARD_MEMBERS: ✅ MATCHED %s (%s) -> %s (direct)", member_name, member_id, team_name)
                         matched = True
                         break
                 
                 # Method 2: Fuzzy word-based matching for full names
                 if not matched:
-                    member_words = member_lower.split()
-                    team_words = team_lower.split()
-                    
                     # Check if team name appears as first word or substring in member name
                     for team_word in team_words:
                         if len(team_word) > 2:  # Skip short words
@@ -964,89 +1243,376 @@ def get_board_members_mapping():
                                             'trello_name': member_name,
                                             'whatsapp': whatsapp
                                         }
-                                        print(f"  BOARD_MEMBERS: ✅ MATCHED {member_name} ({member_id}) -> {team_name} (fuzzy)")
+                                        log.debug("  BOARD_MEMBERS: ✅ MATCHED %s (%s) -> %s (fuzzy)", member_name, member_id, team_name)
                                         matched = True
                                         break
                             if matched:
                                 break
                 
                 if not matched:
-                    print(f"  BOARD_MEMBERS: ❌ No match for '{member_name}' with '{team_name}'")
+                    log.debug("  BOARD_MEMBERS: ❌ No match for '%s' with '%s'", member_name, team_name)
         
-        print(f"  BOARD_MEMBERS: Final mapping has {len(member_mapping)} members")
+        log.debug("  BOARD_MEMBERS: Final mapping has %s members", len(member_mapping))
         
+        if member_mapping:
+            _trello_cache_set(cache_key, member_mapping)
         return member_mapping
         
     except Exception as e:
-        print(f"Error getting board members: {e}")
+        log.error("Error getting board members: %s", e)
         return {}
 
-def get_card_checklists(card_id):
-    """Read Trello card checklists to find assignments."""
+# Assignment phrases looked for in ordinary (non-"assigned") checklist items
+_CHECKLIST_ASSIGNMENT_TEMPLATES = (
+    "@{name}",
+    "{name} -",
+    "{name}:",
+    "assigned to {name}",
+    "{name} responsible",
+    "{name} handle",
+)
+
+# Phrases in meeting transcripts that assign a card to someone
+_TRANSCRIPT_ASSIGNMENT_TEMPLATES = (
+    "{name}, can you",
+    "{name}, please",
+    "{name}, take",
+    "{name} can handle",
+    "{name} will work on",
+    "{name} is assigned",
+    "assign this to {name}",
+    "assign {name}",
+    "{name} should",
+    "{name}, you",
+    "@{name}",
+)
+
+# Mentions in a card's name or description
+_CARD_MENTION_TEMPLATES = (
+    "@{name}",
+    "@ {name}",
+    "{name}",
+    "assigned to {name}",
+)
+
+_team_lower_cache = {}
+_member_matcher_cache = {}
+
+def _team_members_lower(members=None):
+    """Return (name, name_lower, whatsapp) for assignable members (admin/criselle excluded).
+    
+    Cached per team-member set so hot loops don't re-lowercase names per item.
+    """
+    if members is None:
+        members = TEAM_MEMBERS
+    
+    cache_key = tuple(members.items())
+    cached = _team_lower_cache.get(cache_key)
+    if cached is None:
+        cached = tuple((name, name.lower(), whatsapp) for name, whatsapp in members.items()
+                       if name.lower() not in ('admin', 'criselle'))
+        if len(_team_lower_cache) > 32:
+            _team_lower_cache.clear()
+        _team_lower_cache[cache_key] = cached
+    return cached
+
+def _member_pattern_matcher(templates, members=None):
+    """Compile assignment templates for every team member into a single regex.
+    
+    Returns (regex, lookup) where lookup maps a matched phrase to (rank, name, whatsapp),
+    rank being the member's position in the team; regex is None when there are no members.
+    """
+    if members is None:
+        members = TEAM_MEMBERS
+    
+    cache_key = (templates, tuple(members.items()))
+    cached = _member_matcher_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    lookup = {}
+    for rank, (team_member, member_lower, whatsapp) in enumerate(_team_members_lower(members)):
+        for template in templates:
+            lookup.setdefault(template.format(name=member_lower), (rank, team_member, whatsapp))
+    
+    regex = None
+    if lookup:
+        # Longest phrases first so "@lancey" is preferred over "@lance"
+        phrases = sorted(lookup, key=len, reverse=True)
+        regex = re.compile('|'.join(re.escape(phrase) for phrase in phrases))
+    
+    # Team membership rarely changes; keep the cache from growing without bound
+    if len(_member_matcher_cache) > 32:
+        _member_matcher_cache.clear()
+    _member_matcher_cache[cache_key] = (regex, lookup)
+    return regex, lookup
+
+def find_member_mentions(text, templates, members=None):
+    """Scan text once for every member's template phrases.
+    
+    Returns [(name, whatsapp, phrase)] in team order, with the first phrase found per member.
+    """
+    regex, lookup = _member_pattern_matcher(templates, members)
+    if regex is None:
+        return []
+    
+    first_phrase = {}
+    for match in regex.finditer(text):
+        phrase = match.group(0)
+        first_phrase.setdefault(lookup[phrase], phrase)
+    
+    return [(name, whatsapp, phrase) for (rank, name, whatsapp), phrase in sorted(first_phrase.items())]
+
+def get_board_cards_with_checklists(board_id):
+    """Fetch checklists for every open card on a board in a single request.
+    
+    Returns {card_id: checklists} so callers can hand pre-fetched checklists to
+    get_card_checklists instead of making one request per card.
+    """
     try:
-        api_key = os.environ.get('TRELLO_API_KEY')
-        token = os.environ.get('TRELLO_TOKEN')
-        
-        if not api_key or not token:
-            print(f"  CHECKLISTS: Missing Trello API credentials")
-            return []
-        
-        # Get board member mapping first
-        member_mapping = get_board_members_mapping()
+        if not TRELLO_API_KEY or not TRELLO_TOKEN:
+            return {}
         
-        # Get checklists for the card
-        url = f"https://api.trello.com/1/cards/{card_id}/checklists"
+        url = f"https://api.trello.com/1/boards/{board_id}/cards"
         params = {
-            'key': api_key,
-            'token': token,
-            'fields': 'name,checkItems'
+            'key': TRELLO_API_KEY,
+            'token': TRELLO_TOKEN,
+            'filter': 'open',
+            'fields': 'name,url,dateLastActivity',
+            'checklists': 'all'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http.get(url, params=params, timeout=15)
         if response.status_code != 200:
-            print(f"  CHECKLISTS: API error {response.status_code}")
+            log.warning("  CHECKLISTS: Board cards API error %s", response.status_code)
+            return {}
+        
+        return {card['id']: card.get('checklists', []) for card in json_loads(response.content)}
+        
+    except Exception as e:
+        log.error("  CHECKLISTS: Error reading board checklists: %s", e)
+        return {}
+
+def get_matched_cards_checklists(matched_cards):
+    """Pre-fetch checklists for the boards that matched cards belong to."""
+    board_checklists = {}
+    for board_id in {card.get('board_id') for card in matched_cards if card.get('board_id')}:
+        board_checklists.update(get_board_cards_with_checklists(board_id))
+    return board_checklists
+
+def extract_matched_card_discussions(transcript_text, matched_cards):
+    """Parse the transcript once for all matched cards; returns {card_name: discussion}."""
+    try:
+        from meeting_parser import MeetingStructureParser
+        parser = MeetingStructureParser()
+        return parser.extract_card_discussions(
+            transcript_text, [{'name': card_match.get('name', 'Unknown')} for card_match in matched_cards])
+    except Exception as e:
+        log.warning("Meeting parser error for matched cards: %s", e)
+        return {}
+
+# Raw per-card Trello responses, reused within one request or automated scan. Each request
+# keeps its own cache on flask.g; threads outside a request (the scheduler) keep their own.
+CARD_LOOKUP_CACHE_SIZE = 512
+_card_lookup_local = threading.local()
+_card_lookup_cache_lock = threading.Lock()
+
+def _card_lookup_cache():
+    """Return the card lookup cache for the current request, or for this thread outside one."""
+    if has_app_context():
+        if 'card_lookups' not in g:
+            g.card_lookups = {}
+        return g.card_lookups
+    cache = getattr(_card_lookup_local, 'cache', None)
+    if cache is None:
+        cache = _card_lookup_local.cache = {}
+    return cache
+
+def with_card_lookups(fn):
+    """Wrap fn so pool workers share the calling request's (or thread's) card lookup cache."""
+    cache = _card_lookup_cache()
+    
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_card_lookup_local, 'cache', None)
+        _card_lookup_local.cache = cache
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _card_lookup_local.cache = previous
+    return wrapper
+
+def cached_card_lookup(kind, card_id, fetch):
+    """Return fetch(card_id), memoized per (kind, card_id). Failures (None) aren't cached."""
+    cache = _card_lookup_cache()
+    key = (kind, card_id)
+    with _card_lookup_cache_lock:
+        if key in cache:
+            return cache[key]
+    
+    value = fetch(card_id)
+    if value is not None:
+        with _card_lookup_cache_lock:
+            if len(cache) >= CARD_LOOKUP_CACHE_SIZE:
+                cache.clear()
+            cache[key] = value
+    return value
+
+def cached_card_lookup_many(kind, card_ids, fetch_many):
+    """cached_card_lookup for several ids; fetch_many(missing_ids) returns their values in order."""
+    cache = _card_lookup_cache()
+    results = {}
+    with _card_lookup_cache_lock:
+        for card_id in card_ids:
+            if (kind, card_id) in cache:
+                results[card_id] = cache[(kind, card_id)]
+    
+    missing = [card_id for card_id in card_ids if card_id not in results]
+    if missing:
+        values = fetch_many(missing)
+        with _card_lookup_cache_lock:
+            for card_id, value in zip(missing, values):
+                results[card_id] = value
+                if value is not None:
+                    if len(cache) >= CARD_LOOKUP_CACHE_SIZE:
+                        cache.clear()
+                    cache[(kind, card_id)] = value
+    return {card_id: results.get(card_id) for card_id in card_ids}
+
+def reset_card_lookup_cache():
+    """Forget the current request's (or this thread's) cached card lookups."""
+    cache = _card_lookup_cache()
+    with _card_lookup_cache_lock:
+        cache.clear()
+
+def _fetch_card_checklists(card_id):
+    url = f"https://api.trello.com/1/cards/{card_id}/checklists"
+    params = {
+        'key': TRELLO_API_KEY,
+        'token': TRELLO_TOKEN,
+        'fields': 'name,checkItems'
+    }
+    
+    response = _http.get(url, params=params, timeout=10)
+    if response.status_code != 200:
+        log.warning("  CHECKLISTS: API error %s", response.status_code)
+        return None
+    return json_loads(response.content)
+
+def _fetch_card_comments(card_id):
+    url = f"https://api.trello.com/1/cards/{card_id}/actions"
+    params = {
+        'filter': 'commentCard',
+        'limit': 50,  # Increased limit to find more comments
+        'key': TRELLO_API_KEY,
+        'token': TRELLO_TOKEN
+    }
+    
+    response = _http.get(url, params=params, timeout=10)
+    if response.status_code != 200:
+        return None
+    return json_loads(response.content)
+
+# Trello's /1/batch route takes at most this many GET routes per request
+TRELLO_BATCH_SIZE = 10
+
+def _fetch_card_comments_batch(card_ids):
+    """Fetch up to TRELLO_BATCH_SIZE cards' comments (as _fetch_card_comments) in one /1/batch request.
+    
+    Returns a list aligned with card_ids, with None for any route that failed.
+    """
+    routes = [f"/cards/{card_id}/actions?filter=commentCard&limit=50" for card_id in card_ids]
+    params = {
+        'urls': ','.join(routes),
+        'key': TRELLO_API_KEY,
+        'token': TRELLO_TOKEN
+    }
+    
+    try:
+        response = _http.get("https://api.trello.com/1/batch", params=params, timeout=15)
+        if response.status_code != 200:
+            log.warning("  COMMENTS: Batch API error %s", response.status_code)
+            return [None] * len(card_ids)
+        # One {"<status>": body} object per route, in request order
+        results = [item.get('200') if isinstance(item, dict) else None for item in json_loads(response.content)]
+    except Exception as e:
+        log.warning("  COMMENTS: Batch request failed: %s", e)
+        return [None] * len(card_ids)
+    
+    return (results + [None] * len(card_ids))[:len(card_ids)]
+
+def _fetch_card_comments_chunked(card_ids):
+    chunks = [card_ids[i:i + TRELLO_BATCH_SIZE] for i in range(0, len(card_ids), TRELLO_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+        return [comments for chunk_comments in executor.map(_fetch_card_comments_batch, chunks)
+                for comments in chunk_comments]
+
+# Checklist names that hold card assignments
+_ASSIGNMENT_CHECKLIST_RE = re.compile(r'assign|team|member|responsible')
+
+def get_card_checklists(card_id, checklists=None):
+    """Read Trello card checklists to find assignments.
+    
+    Pass already-fetched checklists (e.g. from get_board_cards_with_checklists)
+    to skip the per-card API request.
+    """
+    try:
+        if not TRELLO_API_KEY or not TRELLO_TOKEN:
+            log.warning("  CHECKLISTS: Missing Trello API credentials")
             return []
         
-        checklists = response.json()
+        # Get board member mapping first
+        member_mapping = get_board_members_mapping()
+        
+        if checklists is None:
+            checklists = cached_card_lookup('checklists', card_id, _fetch_card_checklists)
+            if checklists is None:
+                return []
+        
         assigned_members = []
         
+        # Name variations for each mapped board member, built once instead of per checklist item
+        mapped_members = []
+        for member_id, member_info in member_mapping.items():
+            team_lower = member_info['team_name'].lower()
+            trello_lower = member_info['trello_name'].lower()
+            
+            # Skip admin and criselle
+            if team_lower in ['admin', 'criselle']:
+                continue
+            
+            # Enhanced name matching - use both team name and Trello name variations
+            name_variations = (
+                team_lower,
+                trello_lower,
+                team_lower.replace('ey', 'y'),  # Lancey -> Lancy
+                team_lower.replace('y', 'ey'),  # Lancy -> Lancey
+                trello_lower.replace('ey', 'y'),
+                trello_lower.replace('y', 'ey'),
+            )
+            mapped_members.append((member_id, member_info, name_variations))
+        
         for checklist in checklists:
             checklist_name = checklist.get('name', '').lower()
             check_items = checklist.get('checkItems', [])
             
-            # Look for assignment-related checklists - prioritize "assigned" checklist specifically
-            if ('assigned' in checklist_name or 
-                any(keyword in checklist_name for keyword in ['assign', 'team', 'member', 'responsible'])):
-                print(f"  CHECKLISTS: Found assignment checklist: {checklist['name']}")
+            # Look for assignment-related checklists ("assigned", "team", "members", ...)
+            if _ASSIGNMENT_CHECKLIST_RE.search(checklist_name):
+                log.debug("  CHECKLISTS: Found assignment checklist: %s", checklist['name'])
                 
                 for item in check_items:
                     item_text = item.get('name', '').lower()
                     item_state = item.get('state', 'incomplete')
                     
                     # Check if item contains team member names using board member mapping
-                    for member_id, member_info in member_mapping.items():
+                    for member_id, member_info, name_variations in mapped_members:
                         team_name = member_info['team_name']
                         trello_name = member_info['trello_name']
                         whatsapp = member_info['whatsapp']
                         
-                        # Skip admin and criselle
-                        if team_name.lower() in ['admin', 'criselle']:
-                            continue
-                        
-                        # Enhanced name matching - use both team name and Trello name variations
-                        name_variations = [
-                            team_name.lower(),
-                            trello_name.lower(),
-                            team_name.lower().replace('ey', 'y'),  # Lancey -> Lancy
-                            team_name.lower().replace('y', 'ey'),  # Lancy -> Lancey
-                            trello_name.lower().replace('ey', 'y'),
-                            trello_name.lower().replace('y', 'ey'),
-                        ]
-                        
-                        # Check if member is mentioned in checklist item
+                        # Check if member is mentioned in checklist item ("@name" contains "name")
                         is_mentioned = (
                             any(variation in item_text for variation in name_variations) or
-                            any(f"@{variation}" in item_text for variation in name_variations) or
                             member_id in item_text  # Check for Trello member ID
                         )
                         
@@ -1062,72 +1628,60 @@ def get_card_checklists(card_id):
                                 'source': f"Checklist: {checklist['name']} - {item['name']} ({item_state})",
                                 'confidence': confidence,
                                 'member_id': member_id,
-                                'trello_name': trello_name
+                                'trello_name': trello_name,
+                                'is_checklist': True
                             })
-                            print(f"  CHECKLISTS: Found {team_name} ({trello_name}) in checklist item: {item['name']} ({item_state})")
+                            log.debug("  CHECKLISTS: Found %s (%s) in checklist item: %s (%s)", team_name, trello_name, item['name'], item_state)
             
             # Also check regular checklists for team member mentions
             else:
                 for item in check_items:
                     item_text = item.get('name', '').lower()
                     
-                    for team_member, whatsapp in TEAM_MEMBERS.items():
-                        member_lower = team_member.lower()
-                        
-                        if member_lower in ['admin', 'criselle']:
-                            continue
-                        
-                        # Look for assignment patterns in any checklist item
-                        assignment_patterns = [
-                            f"@{member_lower}",
-                            f"{member_lower} -",
-                            f"{member_lower}:",
-                            f"assigned to {member_lower}",
-                            f"{member_lower} responsible",
-                            f"{member_lower} handle"
-                        ]
-                        
-                        if any(pattern in item_text for pattern in assignment_patterns):
-                            assigned_members.append({
-                                'name': team_member,
-                                'whatsapp': whatsapp,
-                                'source': f"Checklist item: {item['name']}",
-                                'confidence': 85
-                            })
-                            print(f"  CHECKLISTS: Found {team_member} in item: {item['name']}")
+                    # One scan per item finds every member's assignment patterns
+                    for team_member, whatsapp, pattern in find_member_mentions(item_text, _CHECKLIST_ASSIGNMENT_TEMPLATES):
+                        assigned_members.append({
+                            'name': team_member,
+                            'whatsapp': whatsapp,
+                            'source': f"Checklist item: {item['name']}",
+                            'confidence': 85,
+                            'is_checklist': True
+                        })
+                        log.debug("  CHECKLISTS: Found %s in item: %s", team_member, item['name'])
         
         return assigned_members
         
     except Exception as e:
-        print(f"  CHECKLISTS: Error reading checklists: {e}")
+        log.error("  CHECKLISTS: Error reading checklists: %s", e)
         return []
 
 def get_last_non_admin_commenter(card_id):
     """Find the last person to comment on a card (excluding admin/criselle)."""
     try:
-        api_key = os.environ.get('TRELLO_API_KEY')
-        token = os.environ.get('TRELLO_TOKEN')
-        
-        if not api_key or not token:
+        if not TRELLO_API_KEY or not TRELLO_TOKEN:
             return None
         
         # Get board member mapping first
         member_mapping = get_board_members_mapping()
         
         # Get recent comments
-        url = f"https://api.trello.com/1/cards/{card_id}/actions"
-        params = {
-            'filter': 'commentCard',
-            'limit': 50,  # Increased limit to find more comments
-            'key': api_key,
-            'token': token
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        if response.status_code != 200:
+        comments = cached_card_lookup('comments', card_id, _fetch_card_comments)
+        if comments is None:
             return None
         
-        comments = response.json()
+        # Name variations per mapped member, built once rather than per comment
+        mapped_variations = []
+        for member_id, member_info in member_mapping.items():
+            team_lower = member_info['team_name'].lower()
+            trello_lower = member_info['trello_name'].lower()
+            mapped_variations.append((member_info, (
+                team_lower,
+                trello_lower,
+                team_lower.replace('ey', 'y'),
+                team_lower.replace('y', 'ey'),
+                trello_lower.replace('ey', 'y'),
+                trello_lower.replace('y', 'ey'),
+            )))
         
         for comment in comments:
             commenter_id = comment.get('memberCreator', {}).get('id', '')
@@ -1151,19 +1705,10 @@ def get_last_non_admin_commenter(card_id):
                 }
             
             # Fallback to name matching if ID not found
-            for member_id, member_info in member_mapping.items():
+            for member_info, name_variations in mapped_variations:
                 team_name = member_info['team_name']
                 trello_name = member_info['trello_name']
                 
-                name_variations = [
-                    team_name.lower(),
-                    trello_name.lower(),
-                    team_name.lower().replace('ey', 'y'),
-                    team_name.lower().replace('y', 'ey'),
-                    trello_name.lower().replace('ey', 'y'),
-                    trello_name.lower().replace('y', 'ey'),
-                ]
-                
                 if any(variation in commenter_name or commenter_name in variation 
                        for variation in name_variations):
                     return {
@@ -1179,94 +1724,169 @@ def get_last_non_admin_commenter(card_id):
         return None
         
     except Exception as e:
-        print(f"  LAST COMMENTER: Error: {e}")
+        log.error("  LAST COMMENTER: Error: %s", e)
         return None
 
+def get_last_non_admin_commenter_batch(card_ids):
+    """Fetch the last non-admin commenter for several cards concurrently.
+    
+    Returns {card_id: commenter or None}.
+    """
+    card_ids = list(dict.fromkeys(card_id for card_id in card_ids if card_id))
+    if not card_ids:
+        return {}
+    
+    # Warm the board member mapping once so the workers don't all fetch it
+    get_board_members_mapping()
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(card_ids))) as executor:
+        return dict(zip(card_ids, executor.map(with_card_lookups(get_last_non_admin_commenter), card_ids)))
+
+# Trello returns at most this many actions per board-level request
+TRELLO_BOARD_ACTIONS_LIMIT = 1000
+
+# Last board-level comments per board as (ETag, {card_id: comments}), revalidated with
+# If-None-Match so an unchanged board isn't downloaded and regrouped on every scan.
+# Boards over TRELLO_BOARD_ACTIONS_LIMIT are cached as (ETag, None) so their scans
+# go straight to the per-card path instead of re-downloading a page they can't use.
+_board_comments_cache = {}
+_board_comments_cache_lock = threading.Lock()
+
+def _fetch_board_comments(board_id):
+    """Return {card_id: comments} for every comment on the board (newest 50 per card, newest first).
+    
+    Returns None if the request fails or the board has more comments than one page
+    holds, since older comments would then be missing for some cards.
+    """
+    url = f"https://api.trello.com/1/boards/{board_id}/actions"
+    params = {
+        'filter': 'commentCard',
+        'limit': TRELLO_BOARD_ACTIONS_LIMIT,
+        'key': TRELLO_API_KEY,
+        'token': TRELLO_TOKEN
+    }
+    
+    with _board_comments_cache_lock:
+        cached = _board_comments_cache.get(board_id)
+    headers = {'If-None-Match': cached[0]} if cached else None
+    
+    try:
+        response = _http.get(url, params=params, headers=headers, timeout=15)
+        if response.status_code == 304 and cached:
+            log.debug("  COMMENTS: Board comments unchanged, using cached copy")
+            return cached[1]
+        if response.status_code != 200:
+            log.warning("  COMMENTS: Board actions API error %s", response.status_code)
+            return None
+        actions = json_loads(response.content)
+    except Exception as e:
+        log.warning("  COMMENTS: Board actions request failed: %s", e)
+        return None
+    
+    if len(actions) >= TRELLO_BOARD_ACTIONS_LIMIT:
+        log.info("  COMMENTS: Board has over %s comments, fetching per card", TRELLO_BOARD_ACTIONS_LIMIT)
+        comments_by_card = None
+    else:
+        comments_by_card = defaultdict(list)
+        for action in actions:
+            card_id = action.get('data', {}).get('card', {}).get('id')
+            if card_id and len(comments_by_card[card_id]) < 50:
+                comments_by_card[card_id].append(action)
+    
+    etag = response.headers.get('ETag')
+    if etag:
+        with _board_comments_cache_lock:
+            _board_comments_cache[board_id] = (etag, comments_by_card)
+    return comments_by_card
+
+def _fetch_card_comments_from_board(board_id, card_ids):
+    comments_by_card = _fetch_board_comments(board_id)
+    if comments_by_card is None:
+        return _fetch_card_comments_chunked(card_ids)
+    return [comments_by_card.get(card_id, []) for card_id in card_ids]
+
+def get_card_comments_batch(card_ids, board_id=None):
+    """Fetch several cards' comment actions, TRELLO_BATCH_SIZE per /1/batch request.
+    
+    With board_id, one board-level /actions request covers every card instead,
+    unless the board has too many comments for a single page.
+    
+    Returns {card_id: comments, or None if the request failed}.
+    """
+    card_ids = list(dict.fromkeys(card_id for card_id in card_ids if card_id))
+    if not card_ids:
+        return {}
+    
+    fetch_many = partial(_fetch_card_comments_from_board, board_id) if board_id else _fetch_card_comments_chunked
+    return cached_card_lookup_many('comments', card_ids, fetch_many)
+
 def extract_transcript_assignments(transcript_text, card_name):
     """AI-powered assignment detection from meeting conversations."""
     try:
-        assignments = []
-        lines = transcript_text.split('\n')
-        card_name_lower = card_name.lower()
+        team_count = len(_team_members_lower())
+        if not team_count:
+            return []
+        
+        card_keywords = [word for word in card_name.lower().split() if len(word) > 3]
+        if not card_keywords:
+            return []
+        
+        # Lowercase the transcript once; lowercasing never adds or removes newlines.
+        # Cards never mentioned anywhere (the common case) skip the line scan entirely.
+        transcript_lower = transcript_text.lower()
+        if not any(word in transcript_lower for word in card_keywords):
+            return []
+        lines = transcript_lower.split('\n')
+        
+        # First assignment found per person (all carry the same confidence)
+        unique_assignments = {}
         
         # Look for assignment patterns around card mentions
         for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
+            # Check if this line mentions the card
+            if not any(word in line for word in card_keywords):
                 continue
             
-            # Check if this line or nearby lines mention the card
-            card_mentioned = any(word in line.lower() for word in card_name_lower.split() if len(word) > 3)
+            # Look in current line and next few lines for assignment patterns
+            context_text = ' '.join(lines[max(0, i-2):i+5])
             
-            if card_mentioned:
-                # Look in current line and next few lines for assignment patterns
-                context_lines = lines[max(0, i-2):min(len(lines), i+5)]
-                context_text = ' '.join(context_lines).lower()
-                
-                # Assignment patterns to look for
-                for team_member, whatsapp in TEAM_MEMBERS.items():
-                    member_lower = team_member.lower()
-                    
-                    # Skip admin and criselle
-                    if member_lower in ['admin', 'criselle']:
-                        continue
-                    
-                    assignment_patterns = [
-                        f"{member_lower}, can you",
-                        f"{member_lower}, please",
-                        f"{member_lower}, take",
-                        f"{member_lower} can handle",
-                        f"{member_lower} will work on",
-                        f"{member_lower} is assigned",
-                        f"assign this to {member_lower}",
-                        f"assign {member_lower}",
-                        f"{member_lower} should",
-                        f"{member_lower}, you",
-                        f"@{member_lower}"
-                    ]
-                    
-                    for pattern in assignment_patterns:
-                        if pattern in context_text:
-                            assignments.append({
-                                'name': team_member,
-                                'whatsapp': whatsapp,
-                                'source': f"Transcript assignment pattern: '{pattern}'",
-                                'confidence': 80,
-                                'context': context_text[:200]
-                            })
-                            print(f"  TRANSCRIPT: Found assignment '{pattern}' for {team_member}")
-                            break
-        
-        # Remove duplicates (same person assigned multiple times)
-        unique_assignments = {}
-        for assignment in assignments:
-            name = assignment['name']
-            if name not in unique_assignments or assignment['confidence'] > unique_assignments[name]['confidence']:
-                unique_assignments[name] = assignment
+            # One scan of the context finds every member's assignment patterns
+            for team_member, whatsapp, pattern in find_member_mentions(context_text, _TRANSCRIPT_ASSIGNMENT_TEMPLATES):
+                if team_member in unique_assignments:
+                    continue
+                unique_assignments[team_member] = {
+                    'name': team_member,
+                    'whatsapp': whatsapp,
+                    'source': f"Transcript assignment pattern: '{pattern}'",
+                    'confidence': 80,
+                    'context': context_text[:200]
+                }
+                log.debug("  TRANSCRIPT: Found assignment '%s' for %s", pattern, team_member)
+            
+            # Every team member already has an assignment; later windows can't add any
+            if len(unique_assignments) == team_count:
+                break
         
         return list(unique_assignments.values())
         
     except Exception as e:
-        print(f"  TRANSCRIPT: Error extracting assignments: {e}")
+        log.error("  TRANSCRIPT: Error extracting assignments: %s", e)
         return []
 
 def apply_default_assignments(card_name, card_description=""):
     """Apply Wendy/Levy defaults when no assignment found."""
     try:
-        card_content = f"{card_name.lower()} {card_description.lower()}".lower()
+        card_content = f"{card_name} {card_description}".lower()
         
-        # Content-based default assignments
-        mobile_keywords = ['mobile', 'app', 'ios', 'android', 'flutter', 'react native']
-        web_keywords = ['website', 'web', 'wordpress', 'landing', 'page', 'frontend', 'html', 'css']
-        
-        if any(keyword in card_content for keyword in mobile_keywords):
+        # Content-based default assignments (same keyword sets the card matcher uses)
+        if any(keyword in card_content for keyword in CARD_KEYWORD_GROUPS['mobile']):
             return {
                 'name': 'Wendy',
                 'whatsapp': TEAM_MEMBERS.get('Wendy'),
                 'source': 'Default assignment: Mobile/App content',
                 'confidence': 60
             }
-        elif any(keyword in card_content for keyword in web_keywords):
+        elif any(keyword in card_content for keyword in CARD_KEYWORD_GROUPS['web']):
             return {
                 'name': 'Levy',
                 'whatsapp': TEAM_MEMBERS.get('Levy'),
@@ -1274,98 +1894,108 @@ def apply_default_assignments(card_name, card_description=""):
                 'confidence': 60
             }
         else:
-            # Random default between Wendy and Levy
-            import random
-            default_assignee = random.choice(['Wendy', 'Levy'])
+            # Split evenly between Wendy and Levy, stable per card name (unlike hash(), crc32 isn't salted per process)
+            default_assignee = ('Wendy', 'Levy')[zlib.crc32(card_name.encode('utf-8')) & 1]
             return {
                 'name': default_assignee,
                 'whatsapp': TEAM_MEMBERS.get(default_assignee),
-                'source': f'Default assignment: Random fallback',
+                'source': 'Default assignment: Fallback',
                 'confidence': 50
             }
     
     except Exception as e:
-        print(f"  DEFAULTS: Error applying defaults: {e}")
+        log.error("  DEFAULTS: Error applying defaults: %s", e)
         return None
 
-def get_enhanced_card_assignment(card, transcript_text=None):
-    """Enhanced assignment detection using all available methods."""
+# Minimal stand-in for a Trello card when only a matched card's id and name are known
+MockCard = namedtuple('MockCard', ['id', 'name', 'description'], defaults=[''])
+
+def get_enhanced_card_assignment(card, transcript_text=None, board_checklists=None, last_commenters=None):
+    """Enhanced assignment detection using all available methods.
+    
+    board_checklists and last_commenters are optional {card_id: ...} maps
+    prefetched for a batch of cards; missing cards are fetched individually.
+    """
     try:
-        print(f"ENHANCED ASSIGNMENT: Processing card {card.name}")
+        log.debug("ENHANCED ASSIGNMENT: Processing card %s", card.name)
         all_assignments = []
         
         # Method 1: Check checklists (highest priority)
-        checklist_assignments = get_card_checklists(card.id)
+        prefetched_checklists = board_checklists.get(card.id) if board_checklists else None
+        checklist_assignments = get_card_checklists(card.id, prefetched_checklists)
         all_assignments.extend(checklist_assignments)
-        print(f"  Method 1 - Checklists: Found {len(checklist_assignments)} assignments")
+        log.debug("  Method 1 - Checklists: Found %s assignments", len(checklist_assignments))
+        
+        # Checklists outrank every other method, so the first one found would win anyway;
+        # skip the comment fetch and transcript/description scans
+        if checklist_assignments:
+            best_assignment = checklist_assignments[0]
+            log.debug("  SELECTED: %s (confidence: %s, source: %s)", best_assignment['name'], best_assignment['confidence'], best_assignment['source'])
+            return best_assignment['name'], best_assignment['whatsapp'], all_assignments
         
         # Method 2: Get last non-admin commenter
-        last_commenter = get_last_non_admin_commenter(card.id)
+        if last_commenters is not None and card.id in last_commenters:
+            last_commenter = last_commenters[card.id]
+        else:
+            last_commenter = get_last_non_admin_commenter(card.id)
         if last_commenter:
             all_assignments.append(last_commenter)
-            print(f"  Method 2 - Last commenter: {last_commenter['name']}")
+            log.debug("  Method 2 - Last commenter: %s", last_commenter['name'])
         
         # Method 3: Transcript analysis (if available)
         if transcript_text:
             transcript_assignments = extract_transcript_assignments(transcript_text, card.name)
             all_assignments.extend(transcript_assignments)
-            print(f"  Method 3 - Transcript: Found {len(transcript_assignments)} assignments")
+            log.debug("  Method 3 - Transcript: Found %s assignments", len(transcript_assignments))
         
         # Method 4: Existing description/name patterns (from original code)
-        card_description = (card.description or '').lower()
-        card_name_lower = card.name.lower()
-        
-        for member_name, whatsapp_num in TEAM_MEMBERS.items():
-            member_lower = member_name.lower()
-            
-            if member_lower in ['admin', 'criselle']:
-                continue
-            
-            patterns_to_check = [
-                f"@{member_lower}",
-                f"@ {member_lower}",
-                member_lower,
-                f"assigned to {member_lower}",
-            ]
-            
-            for pattern in patterns_to_check:
-                if pattern in card_description or pattern in card_name_lower:
-                    all_assignments.append({
-                        'name': member_name,
-                        'whatsapp': whatsapp_num,
-                        'source': f'Description/name pattern: {pattern}',
-                        'confidence': 70
-                    })
-                    print(f"  Method 4 - Patterns: Found {member_name}")
-                    break
+        # Newline keeps matches from spanning the description and the name
+        card_text = f"{(card.description or '').lower()}\n{card.name.lower()}"
+        
+        for member_name, whatsapp_num, pattern in find_member_mentions(card_text, _CARD_MENTION_TEMPLATES):
+            all_assignments.append({
+                'name': member_name,
+                'whatsapp': whatsapp_num,
+                'source': f'Description/name pattern: {pattern}',
+                'confidence': 70
+            })
+            log.debug("  Method 4 - Patterns: Found %s", member_name)
         
         # Select best assignment (highest confidence, prioritize checklists)
         if all_assignments:
-            # Sort by confidence, prioritize checklist sources
-            sorted_assignments = sorted(all_assignments, key=lambda x: (
-                100 if 'checklist' in x['source'].lower() else x['confidence']
-            ), reverse=True)
-            
-            best_assignment = sorted_assignments[0]
-            print(f"  SELECTED: {best_assignment['name']} (confidence: {best_assignment['confidence']}, source: {best_assignment['source']})")
+            # Checklist sources rank as 100; ties keep the first found, as the stable sort did
+            best_assignment = max(all_assignments, key=lambda x: (
+                100 if x.get('is_checklist') else x['confidence']
+            ))
+            log.debug("  SELECTED: %s (confidence: %s, source: %s)", best_assignment['name'], best_assignment['confidence'], best_assignment['source'])
             
             return best_assignment['name'], best_assignment['whatsapp'], all_assignments
         
         # Method 5: Apply defaults if nothing found
         default_assignment = apply_default_assignments(card.name, card.description)
         if default_assignment:
-            print(f"  FALLBACK: {default_assignment['name']} (default assignment)")
+            log.debug("  FALLBACK: %s (default assignment)", default_assignment['name'])
             return default_assignment['name'], default_assignment['whatsapp'], [default_assignment]
         
-        print(f"  RESULT: No assignment found for card {card.name}")
+        log.debug("  RESULT: No assignment found for card %s", card.name)
         return None, None, []
         
     except Exception as e:
-        print(f"Enhanced assignment error for {card.name}: {e}")
+        log.error("Enhanced assignment error for %s: %s", card.name, e)
         return None, None, []
 
 # ===== OPTIMIZED TRANSCRIPT PROCESSING =====
 
+# Header/metadata lines in the Trello Board Review section
+_NOTES_SKIP_RE = re.compile(r'trello|board|review|task|assignment|---|===|section')
+# Task lines: a bullet, a digit in the first three characters, or a task keyword anywhere
+_NOTES_TASK_LINE_RE = re.compile(
+    r'^(?:[•*-]|.{0,2}\d)'
+    r'|organize|create|update|fix|build|center|mobile|app|wordpress|court|document'
+)
+# Leading bullet or single-digit list number stripped from a task line
+_NOTES_BULLET_RE = re.compile(r'[•*-]|[1-9]\.')
+
 def extract_cards_from_notes(trello_review_text):
     """Extract card names/tasks from Trello Board Review section in Notes."""
     try:
@@ -1384,35 +2014,29 @@ def extract_cards_from_notes(trello_review_text):
             line_lower = line.lower()
             
             # Skip headers and metadata
-            if any(skip in line_lower for skip in ['trello', 'board', 'review', 'task', 'assignment', '---', '===', 'section']):
+            if _NOTES_SKIP_RE.search(line_lower):
                 continue
                 
             # Look for bullet points, numbered items, or task descriptions
-            if (line.startswith('•') or line.startswith('-') or line.startswith('*') or 
-                any(char.isdigit() for char in line[:3]) or
-                any(keyword in line_lower for keyword in ['organize', 'create', 'update', 'fix', 'build', 'center', 'mobile', 'app', 'wordpress', 'court', 'document'])):
+            if _NOTES_TASK_LINE_RE.search(line_lower):
                 
                 # Clean up the line
-                clean_line = line
-                for prefix in ['•', '-', '*', '1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.']:
-                    if clean_line.startswith(prefix):
-                        clean_line = clean_line[len(prefix):].strip()
-                        break
+                bullet = _NOTES_BULLET_RE.match(line)
+                clean_line = line[bullet.end():].strip() if bullet else line
                 
                 if len(clean_line) > 10:  # Meaningful task description
                     cards_mentioned.append(clean_line)
         
-        try:
-            safe_cards = [card.encode('ascii', errors='replace').decode('ascii') for card in cards_mentioned]
-            print(f"Extracted cards from Notes: {safe_cards}")
-        except:
-            print(f"Extracted {len(cards_mentioned)} cards from Notes")
+        log.debug("Extracted cards from Notes: %s", cards_mentioned)
         return cards_mentioned
         
     except Exception as e:
-        print(f"Error extracting cards from notes: {e}")
+        log.error("Error extracting cards from notes: %s", e)
         return []
 
+# Key terms that boost a Notes card -> Trello card match when both mention them
+NOTES_KEY_TERMS = ('mobile', 'app', 'court', 'document', 'wordpress', 'center', 'organize')
+
 def match_notes_cards_to_trello(notes_cards, transcript_text):
     """Match cards from Notes against Trello board and find transcript discussions."""
     try:
@@ -1420,41 +2044,46 @@ def match_notes_cards_to_trello(notes_cards, transcript_text):
             return []
         
         # Get Trello cards
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
-        for board in boards:
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        eeinteractive_board = _get_eeinteractive_board()
         
         if not eeinteractive_board:
-            print("EEInteractive board not found")
+            log.warning("EEInteractive board not found")
             return []
         
-        trello_cards = eeinteractive_board.list_cards()
+        trello_cards = _get_eeinteractive_cards()
         matched_cards = []
         
+        # Index the open Trello cards once: lowercased name, words and key terms
+        indexed_cards = []
+        for trello_card in trello_cards:
+            if trello_card.closed:
+                continue
+            
+            # Skip READ - RULES card
+            if 'READ - RULES WHEN ADDING TASK - DO NOT DELETE' in trello_card.name:
+                continue
+            
+            trello_name_lower = trello_card.name.lower()
+            trello_words = card_name_tokens(trello_name_lower)
+            indexed_cards.append((
+                trello_card,
+                trello_name_lower,
+                trello_words,
+                {term for term in NOTES_KEY_TERMS if term in trello_name_lower},
+            ))
+        
         for notes_card in notes_cards:
             notes_card_lower = notes_card.lower()
+            notes_words = set(significant_words(notes_card_lower))
+            notes_terms = {term for term in NOTES_KEY_TERMS if term in notes_card_lower}
             best_match = None
             best_confidence = 0
             
-            for trello_card in trello_cards:
-                if trello_card.closed:
-                    continue
-                
-                # Skip READ - RULES card
-                if 'READ - RULES WHEN ADDING TASK - DO NOT DELETE' in trello_card.name:
-                    continue
-                
+            for trello_card, trello_name_lower, trello_words, trello_terms in indexed_cards:
                 # Calculate similarity
-                trello_name_lower = trello_card.name.lower()
                 confidence = 0
                 
                 # Word overlap scoring
-                notes_words = set(word for word in notes_card_lower.split() if len(word) > 2)
-                trello_words = set(word for word in trello_name_lower.split() if len(word) > 2)
-                
                 if notes_words and trello_words:
                     overlap = len(notes_words.intersection(trello_words))
                     confidence = (overlap / len(notes_words.union(trello_words))) * 100
@@ -1464,10 +2093,7 @@ def match_notes_cards_to_trello(notes_cards, transcript_text):
                     confidence += 50
                 
                 # Check for partial matches of key terms
-                key_terms = ['mobile', 'app', 'court', 'document', 'wordpress', 'center', 'organize']
-                for term in key_terms:
-                    if term in notes_card_lower and term in trello_name_lower:
-                        confidence += 20
+                confidence += 20 * len(notes_terms & trello_terms)
                 
                 if confidence > best_confidence and confidence >= 40:
                     best_confidence = confidence
@@ -1478,17 +2104,13 @@ def match_notes_cards_to_trello(notes_cards, transcript_text):
                         'confidence': confidence,
                         'description': trello_card.description[:200] if trello_card.description else '',
                         'board_name': eeinteractive_board.name,
+                        'board_id': eeinteractive_board.id,
                         'match_type': 'notes_to_trello',
                         'notes_reference': notes_card
                     }
             
             if best_match:
-                try:
-                    safe_notes = notes_card.encode('ascii', errors='replace').decode('ascii')
-                    safe_name = best_match['name'].encode('ascii', errors='replace').decode('ascii')
-                    print(f"NOTES MATCH: '{safe_notes}' → '{safe_name}' (confidence: {best_confidence:.1f}%)")
-                except:
-                    print(f"NOTES MATCH: [card with special chars] → [trello card] (confidence: {best_confidence:.1f}%)")
+                log.debug("NOTES MATCH: '%s' → '%s' (confidence: %.1f%%)", notes_card, best_match['name'], best_confidence)
                 
                 # Now find transcript discussion for this card using meeting parser
                 try:
@@ -1502,19 +2124,140 @@ def match_notes_cards_to_trello(notes_cards, transcript_text):
                         best_match['transcript_discussion'] = discussion_data.get('discussion', '')
                         best_match['discussion_summary'] = discussion_data.get('summary', '')
                         best_match['discussion_confidence'] = discussion_data.get('confidence', 0)
-                        print(f"Found transcript discussion for '{best_match['name']}'")
+                        log.debug("Found transcript discussion for '%s'", best_match['name'])
                     
                 except Exception as parser_error:
-                    print(f"Meeting parser error for {best_match['name']}: {parser_error}")
+                    log.warning("Meeting parser error for %s: %s", best_match['name'], parser_error)
                 
                 matched_cards.append(best_match)
         
         return matched_cards
         
     except Exception as e:
-        print(f"Error matching notes cards to Trello: {e}")
+        log.error("Error matching notes cards to Trello: %s", e)
         return []
 
+# Enhanced keyword sets for better matching
+CARD_KEYWORD_GROUPS = {
+    'mobile': ('mobile', 'app', 'ios', 'android', 'flutter', 'react native'),
+    'web': ('website', 'web', 'wordpress', 'landing', 'page', 'frontend', 'html', 'css'),
+    'court': ('court', 'legal', 'document', 'evidence', 'case', 'organize'),
+    'center': ('center', 'centre', 'vitality', 'quantum', 'healing', 'energy'),
+    'eesystem': ('eesystem', 'ee system', 'scalar', 'wellness'),
+    'design': ('design', 'logo', 'brand', 'graphics', 'visual'),
+    'funnel': ('funnel', 'landing', 'page', 'ghl', 'gohighlevel'),
+    'calendar': ('calendar', 'schedule', 'booking', 'appointment'),
+    'social': ('social', 'media', 'facebook', 'instagram', 'marketing'),
+}
+
+# One bit per keyword group, so group overlap is a single AND + popcount
+CARD_KEYWORD_GROUP_BITS = {group_name: 1 << index for index, group_name in enumerate(CARD_KEYWORD_GROUPS)}
+
+# Common task patterns
+CARD_TASK_PATTERNS = ('organize', 'create', 'update', 'fix', 'build', 'improve', 'add', 'upload')
+
+# Runs of 3+ letters/digits; punctuation splits words so "website," matches "website"
+_SIGNIFICANT_WORD_RE = re.compile(r'[^\W_]{3,}')
+
+def significant_words(text_lower):
+    """Words of 3+ letters/digits in already-lowercased text."""
+    return _SIGNIFICANT_WORD_RE.findall(text_lower)
+
+@lru_cache(maxsize=4096)
+def card_name_tokens(card_name_lower):
+    """Return the frozenset of words longer than 2 chars in a lowercased card name.
+    
+    Shared by the card matchers, which all tokenize the same board cards;
+    callers lowercase first so each card has a single cache entry.
+    """
+    return frozenset(significant_words(card_name_lower))
+
+def keyword_group_mask(text, contains=None):
+    """Bitmask (see CARD_KEYWORD_GROUP_BITS) of the keyword groups mentioned in lowercased text."""
+    if contains is None:
+        contains = text.__contains__
+    mask = 0
+    for group_name, keywords in CARD_KEYWORD_GROUPS.items():
+        if any(contains(keyword) for keyword in keywords):
+            mask |= CARD_KEYWORD_GROUP_BITS[group_name]
+    return mask
+
+@lru_cache(maxsize=1024)
+def card_keyword_mask(card_name_lower):
+    """Keyword group mask of a lowercased card name.
+    
+    Cached by name: the same board cards are scored against every meeting.
+    """
+    return keyword_group_mask(card_name_lower)
+
+def text_contains_lookup(text):
+    """Return a memoized `term in text` check.
+    
+    Card names on a board share a lot of words ("update", "website", ...), so
+    each distinct term is searched for in the meeting text at most once.
+    """
+    seen = {}
+    
+    def contains(term):
+        found = seen.get(term)
+        if found is None:
+            found = seen[term] = term in text
+        return found
+    
+    return contains
+
+def text_match_features(all_text):
+    """Per-text inputs for score_card_against_text, computed once per meeting.
+    
+    Returns (text_words, keyword group mask, has_task_pattern, memoized
+    substring lookup).
+    """
+    contains = text_contains_lookup(all_text)
+    text_words = set(significant_words(all_text))
+    text_mask = keyword_group_mask(all_text, contains)
+    text_has_task = any(contains(pattern) for pattern in CARD_TASK_PATTERNS)
+    return text_words, text_mask, text_has_task, contains
+
+def score_card_against_text(card_name_lower, all_text, features=None):
+    """Score a lowercased card name against lowercased meeting text.
+    
+    Pass features from text_match_features() when scoring many cards against
+    the same text. Returns (confidence, matched keyword group names).
+    Confidence is uncapped; callers clamp it for display.
+    """
+    text_words, text_mask, text_has_task, contains = features or text_match_features(all_text)
+    confidence = 0
+    matched_groups = []
+    
+    # Strategy 1: Direct name matching
+    if contains(card_name_lower):
+        confidence += 80
+    
+    # Strategy 2: Word overlap with higher scoring
+    card_words = card_name_tokens(card_name_lower)
+    
+    if card_words and text_words:
+        overlap = len(card_words.intersection(text_words))
+        confidence += (overlap / len(card_words)) * 60
+    
+    # Strategy 3: Keyword group matching
+    shared_groups = card_keyword_mask(card_name_lower) & text_mask
+    if shared_groups:
+        confidence += 40 * shared_groups.bit_count()
+        matched_groups = [group_name for group_name, bit in CARD_KEYWORD_GROUP_BITS.items()
+                          if shared_groups & bit]
+    
+    # Strategy 4: Partial substring matching
+    for word in card_name_lower.split():
+        if len(word) > 4 and contains(word):
+            confidence += 25
+    
+    # Strategy 5: Common task patterns
+    if text_has_task and any(pattern in card_name_lower for pattern in CARD_TASK_PATTERNS):
+        confidence += 20
+    
+    return confidence, matched_groups
+
 def enhanced_card_matching_no_ai(transcript_text, doc_content=None):
     """Enhanced card matching without OpenAI dependency using multiple strategies."""
     try:
@@ -1522,17 +2265,12 @@ def enhanced_card_matching_no_ai(transcript_text, doc_content=None):
             return []
         
         # Get Trello board
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
-        for board in boards:
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        eeinteractive_board = _get_eeinteractive_board()
         
         if not eeinteractive_board:
             return []
         
-        cards = eeinteractive_board.list_cards()
+        cards = _get_eeinteractive_cards()
         matched_cards = []
         
         # Combine all available text sources
@@ -1543,63 +2281,19 @@ def enhanced_card_matching_no_ai(transcript_text, doc_content=None):
             if doc_content.get('raw_text'):
                 all_text += " " + doc_content['raw_text'].lower()
         
-        print(f"Enhanced matching using {len(all_text)} characters of content")
-        
-        # Enhanced keyword sets for better matching
-        keyword_groups = {
-            'mobile': ['mobile', 'app', 'ios', 'android', 'flutter', 'react native'],
-            'web': ['website', 'web', 'wordpress', 'landing', 'page', 'frontend', 'html', 'css'],
-            'court': ['court', 'legal', 'document', 'evidence', 'case', 'organize'],
-            'center': ['center', 'centre', 'vitality', 'quantum', 'healing', 'energy'],
-            'eesystem': ['eesystem', 'ee system', 'scalar', 'wellness'],
-            'design': ['design', 'logo', 'brand', 'graphics', 'visual'],
-            'funnel': ['funnel', 'landing', 'page', 'ghl', 'gohighlevel'],
-            'calendar': ['calendar', 'schedule', 'booking', 'appointment'],
-            'social': ['social', 'media', 'facebook', 'instagram', 'marketing']
-        }
+        log.info("Enhanced matching using %s characters of content", len(all_text))
+        
+        # Split and scan the combined text once, not once per card
+        features = text_match_features(all_text)
         
         for card in cards:
             if card.closed or 'READ - RULES WHEN ADDING TASK - DO NOT DELETE' in card.name:
                 continue
             
             card_name_lower = card.name.lower()
-            confidence = 0
-            
-            # Strategy 1: Direct name matching
-            if card_name_lower in all_text:
-                confidence += 80
-            
-            # Strategy 2: Word overlap with higher scoring
-            card_words = set(word for word in card_name_lower.split() if len(word) > 2)
-            text_words = set(all_text.split())
-            
-            if card_words and text_words:
-                overlap = len(card_words.intersection(text_words))
-                word_score = (overlap / len(card_words)) * 60
-                confidence += word_score
-            
-            # Strategy 3: Keyword group matching
-            for group_name, keywords in keyword_groups.items():
-                card_has_group = any(keyword in card_name_lower for keyword in keywords)
-                text_has_group = any(keyword in all_text for keyword in keywords)
-                
-                if card_has_group and text_has_group:
-                    confidence += 40
-                    print(f"Keyword group match '{group_name}': {card.name}")
-            
-            # Strategy 4: Partial substring matching
-            for word in card_name_lower.split():
-                if len(word) > 4:
-                    if word in all_text:
-                        confidence += 25
-            
-            # Strategy 5: Common task patterns
-            task_patterns = ['organize', 'create', 'update', 'fix', 'build', 'improve', 'add', 'upload']
-            card_has_task = any(pattern in card_name_lower for pattern in task_patterns)
-            text_has_task = any(pattern in all_text for pattern in task_patterns)
-            
-            if card_has_task and text_has_task:
-                confidence += 20
+            confidence, matched_groups = score_card_against_text(card_name_lower, all_text, features)
+            for group_name in matched_groups:
+                log.debug("Keyword group match '%s': %s", group_name, card.name)
             
             if confidence >= 30:  # Lower threshold for enhanced matching
                 matched_cards.append({
@@ -1609,16 +2303,17 @@ def enhanced_card_matching_no_ai(transcript_text, doc_content=None):
                     'confidence': min(100, confidence),
                     'description': card.description[:200] if card.description else '',
                     'board_name': eeinteractive_board.name,
+                    'board_id': eeinteractive_board.id,
                     'match_type': 'enhanced_no_ai'
                 })
-                print(f"ENHANCED MATCH: '{card.name}' (confidence: {confidence:.1f}%)")
+                log.debug("ENHANCED MATCH: '%s' (confidence: %.1f%%)", card.name, confidence)
         
         # Sort by confidence
         matched_cards.sort(key=lambda x: x.get('confidence', 0), reverse=True)
         return matched_cards[:15]  # Return top 15 matches
         
     except Exception as e:
-        print(f"Enhanced matching error: {e}")
+        log.error("Enhanced matching error: %s", e)
         return []
 
 def scan_trello_cards_fast(transcript_text):
@@ -1626,39 +2321,31 @@ def scan_trello_cards_fast(transcript_text):
     matched_cards = []
     
     if not trello_client:
-        print("No Trello client available")
+        log.warning("No Trello client available")
         return matched_cards
     
     try:
-        print("Starting fast card scan...")
+        log.info("Starting fast card scan...")
         start_time = time.time()
         
         # Get only the EEInteractive board
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
-        
-        for board in boards:
-            if board.closed:
-                continue
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        eeinteractive_board = _get_eeinteractive_board()
         
         if not eeinteractive_board:
-            print("EEInteractive board not found")
+            log.warning("EEInteractive board not found")
             return matched_cards
         
-        print(f"Found board: {eeinteractive_board.name}")
+        log.debug("Found board: %s", eeinteractive_board.name)
         
         # Get cards - use basic list_cards() instead of all_cards() to avoid heavy API calls
-        cards = eeinteractive_board.list_cards()
-        print(f"Retrieved {len(cards)} cards in {time.time() - start_time:.2f}s")
+        cards = _get_eeinteractive_cards()
+        log.info("Retrieved %s cards in %.2fs", len(cards), time.time() - start_time)
         
         # Debug: show first few card names
         if cards:
-            print(f"Sample cards: {[card.name[:50] for card in cards[:5]]}")
+            log.debug("Sample cards: %s", [card.name[:50] for card in cards[:5]])
         else:
-            print("WARNING: No cards retrieved from board!")
+            log.warning("No cards retrieved from board!")
         
         # Use enhanced AI for intelligent matching if available
         try:
@@ -1674,10 +2361,11 @@ def scan_trello_cards_fast(transcript_text):
                         'name': card.name,
                         'description': card.description[:200] if card.description else '',
                         'url': card.url,
-                        'board_name': eeinteractive_board.name
+                        'board_name': eeinteractive_board.name,
+                        'board_id': eeinteractive_board.id
                     })
             
-            print(f"Prepared {len(simple_cards)} cards for AI matching")
+            log.debug("Prepared %s cards for AI matching", len(simple_cards))
             
             # AI matching with timeout
             ai_start = time.time()
@@ -1685,16 +2373,19 @@ def scan_trello_cards_fast(transcript_text):
             ai_time = time.time() - ai_start
             
             matched_cards.extend(ai_matches)
-            print(f"AI matched {len(ai_matches)} cards in {ai_time:.2f}s")
+            log.info("AI matched %s cards in %.2fs", len(ai_matches), ai_time)
             
         except Exception as e:
-            print(f"AI matching failed, using basic matching: {e}")
+            log.warning("AI matching failed, using basic matching: %s", e)
         
         # Fallback to basic keyword matching if needed
         if len(matched_cards) < 3:
-            print(f"Using fallback keyword matching... (currently have {len(matched_cards)} matches)")
+            log.info("Using fallback keyword matching... (currently have %s matches)", len(matched_cards))
             
             transcript_lower = transcript_text.lower()
+            transcript_words = transcript_lower.split()
+            contains = text_contains_lookup(transcript_lower)
+            matched_ids = {match.get('id') for match in matched_cards}
             
             for card in cards[:30]:  # Limit for speed
                 if card.closed:
@@ -1705,31 +2396,32 @@ def scan_trello_cards_fast(transcript_text):
                     continue
                 
                 # Skip if already matched by AI
-                if any(match.get('id') == card.id for match in matched_cards):
+                if card.id in matched_ids:
                     continue
                 
                 confidence = 0
                 card_name_lower = card.name.lower()
                 
                 # Direct name matching
-                if card_name_lower in transcript_lower:
+                if contains(card_name_lower):
                     confidence += 70
                 
                 # Word-by-word matching with improved logic
                 card_words = card_name_lower.split()
                 for word in card_words:
                     if len(word) > 2:  # Reduced from 3 to 2 for better matching
-                        if word in transcript_lower:
+                        if contains(word):
                             confidence += 15
                         # Also check for partial matches in longer words
                         elif len(word) > 4:
-                            for transcript_word in transcript_lower.split():
+                            for transcript_word in transcript_words:
                                 if word in transcript_word or transcript_word in word:
                                     confidence += 8
                                     break
                 
                 if confidence >= 25:  # Even lower threshold for better matching
-                    print(f"MATCHED: '{card.name}' with confidence {confidence}")
+                    log.debug("MATCHED: '%s' with confidence %s", card.name, confidence)
+                    matched_ids.add(card.id)
                     matched_cards.append({
                         'id': card.id,
                         'name': card.name,
@@ -1737,16 +2429,17 @@ def scan_trello_cards_fast(transcript_text):
                         'confidence': min(100, confidence),
                         'description': card.description[:200] if card.description else '',
                         'board_name': eeinteractive_board.name,
+                        'board_id': eeinteractive_board.id,
                         'match_type': 'keyword_fallback'
                     })
                 elif confidence > 0:
-                    print(f"LOW CONFIDENCE: '{card.name}' with confidence {confidence} (below threshold)")
+                    log.debug("LOW CONFIDENCE: '%s' with confidence %s (below threshold)", card.name, confidence)
         
         # Sort by confidence
         matched_cards.sort(key=lambda x: x.get('confidence', 0), reverse=True)
         
         total_time = time.time() - start_time
-        print(f"Card matching completed in {total_time:.2f}s, found {len(matched_cards)} matches")
+        log.info("Card matching completed in %.2fs, found %s matches", total_time, len(matched_cards))
         
         return matched_cards[:10]  # Return top 10 matches
         
@@ -1754,6 +2447,56 @@ def scan_trello_cards_fast(transcript_text):
         print(f"Error in fast card matching: {e}")
         return []
 
+def lines_with_lower(text):
+    """Return (line, line_lower) pairs, lowercasing the whole text in one pass.
+    
+    Lowercasing never adds or removes newlines, so the two splits stay aligned.
+    """
+    return zip(text.split('\n'), text.lower().split('\n'))
+
+# Sections of extract_google_doc_content kept as continuous text; the rest are item lists
+DOC_TEXT_SECTIONS = ('notes_tab_content', 'transcript_tab_content', 'trello_board_review', 'meeting_summary')
+DOC_LIST_SECTIONS = ('key_points', 'decisions', 'action_items', 'objectives')
+
+def iter_doc_sections(doc_text):
+    """Yield (section, item) for each line of a Google Doc's text as it is classified.
+    
+    section is a DOC_TEXT_SECTIONS or DOC_LIST_SECTIONS key; header lines and lines
+    that belong to no section are not yielded. Callers that need only some
+    sections can drop the rest as they go.
+    """
+    current_section = 'general'
+    
+    for line, line_lower in lines_with_lower(doc_text):
+        line = line.strip()
+        if not line:
+            continue
+            
+        line_lower = line_lower.strip()
+        
+        # Detect document tabs and sections (most lines mention no section keyword)
+        if _DOC_SECTION_HINT_RE.search(line_lower):
+            header = next(((section, label) for section, pattern, label in _DOC_SECTION_PATTERNS
+                           if pattern.search(line_lower)), None)
+            if header:
+                current_section, label = header
+                if label:
+                    print(f"Found {label} section")
+                continue
+            
+        # Extract content based on section
+        if current_section in DOC_TEXT_SECTIONS:
+            # For tabs and summaries, capture all content as continuous text
+            yield current_section, line
+        elif line.startswith(('•', '-', '*')):
+            if current_section in DOC_LIST_SECTIONS:
+                yield current_section, line[1:].strip()
+        elif any(char.isdigit() for char in line[:3]):  # numbered item, e.g. "1." or "12)"
+            if current_section in DOC_LIST_SECTIONS:
+                yield current_section, line
+        elif current_section == 'general' and len(line) > 20:
+            yield 'key_points', line
+
 def extract_google_doc_content(doc_url):
     """Extract comprehensive content from Google Doc including notes and context."""
     try:
@@ -1766,127 +2509,153 @@ def extract_google_doc_content(doc_url):
             return None
             
         # Parse structured content including Notes and Transcript tabs
-        content = {
-            'raw_text': doc_content,
-            'key_points': [],
-            'decisions': [],
-            'action_items': [],
-            'objectives': [],
-            'notes_tab_content': '',
-            'transcript_tab_content': '',
-            'trello_board_review': '',
-            'meeting_summary': ''
-        }
+        content = {'raw_text': doc_content}
+        content.update((section, []) for section in DOC_LIST_SECTIONS)
         
-        lines = doc_content.split('\n')
-        current_section = 'general'
+        # Tab/summary sections collect lines here and are joined once at the end
+        text_lines = {section: [] for section in DOC_TEXT_SECTIONS}
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        for section, item in iter_doc_sections(doc_content):
+            (text_lines if section in text_lines else content)[section].append(item)
+        
+        for section, section_lines in text_lines.items():
+            content[section] = '\n'.join(section_lines)
                 
-            line_lower = line.lower()
-            
-            # Detect document tabs and sections
-            if 'notes:' in line_lower or line_lower.startswith('notes'):
-                current_section = 'notes_tab_content'
-                print("Found Notes tab section")
-                continue
-            elif 'transcript:' in line_lower or line_lower.startswith('transcript'):
-                current_section = 'transcript_tab_content'
-                print("Found Transcript tab section")
-                continue
-            elif 'trello board review' in line_lower and 'task assignments' in line_lower:
-                current_section = 'trello_board_review'
-                print("Found Trello Board Review section")
-                continue
-            elif any(keyword in line_lower for keyword in ['meeting summary', 'summary', 'overall summary']):
-                current_section = 'meeting_summary'
-                continue
-            elif any(keyword in line_lower for keyword in ['key points', 'main points', 'highlights']):
-                current_section = 'key_points'
-                continue
-            elif any(keyword in line_lower for keyword in ['decisions', 'resolved', 'agreed']):
-                current_section = 'decisions'
-                continue
-            elif any(keyword in line_lower for keyword in ['action items', 'next steps', 'todo']):
-                current_section = 'action_items'
-                continue
-            elif any(keyword in line_lower for keyword in ['objectives', 'goals', 'purpose']):
-                current_section = 'objectives'
-                continue
+        return content
+        
+    except Exception as e:
+        print(f"Error extracting Google Doc content: {e}")
+        return None
+
+@dataclass(slots=True)
+class SpeakerStats:
+    """Raw per-speaker counts gathered by scan_transcript_lines."""
+    total_words: int = 0
+    total_messages: int = 0
+    questions_asked: int = 0
+    decisions_made: int = 0
+    
+    def as_metrics(self, meeting_words):
+        """Metrics dict as returned by calculate_speaker_metrics, given the meeting's total words."""
+        if meeting_words > 0:
+            participation = round((self.total_words / meeting_words) * 100, 1)
+        else:
+            participation = 0
+        
+        # Engagement score (0-100)
+        engagement = (min(participation * 2, 40)  # Speaking participation (max 40)
+                      + min(self.questions_asked * 10, 30)  # Questions (max 30)
+                      + min(self.decisions_made * 15, 30))  # Decision-making (max 30)
+        
+        return {
+            'total_words': self.total_words,
+            'total_messages': self.total_messages,
+            'avg_message_length': round(self.total_words / self.total_messages, 1) if self.total_messages > 0 else 0,
+            'questions_asked': self.questions_asked,
+            'decisions_made': self.decisions_made,
+            'engagement_score': min(round(engagement), 100),
+            'participation_percentage': participation
+        }
+
+def scan_transcript_lines(transcript):
+    """Walk the transcript once, collecting what the meeting analysis steps need.
+    
+    Returns a dict with 'participants' (as extract_participants_fast),
+    'discussions', 'decisions', 'action_items' and SpeakerStats per speaker in
+    'speakers', so analyze_meeting_transcript and calculate_speaker_metrics
+    don't each re-split and re-scan the text.
+    """
+    participants = set()
+    discussions = []
+    current_topic = []  # lines of the topic being collected, joined when it ends
+    decisions = []
+    action_items = []
+    speakers = defaultdict(SpeakerStats)
+    
+    for index, (raw_line, line_lower) in enumerate(lines_with_lower(transcript)):
+        line = raw_line.strip()
+        if not line:
+            continue
+        
+        # Participants: first 50 lines, up to 10 speakers
+        if index < 50 and len(participants) < 10:
+            speaker_match = _PARTICIPANT_LINE_RE.match(line)
+            if speaker_match:
+                speaker = speaker_match.group(1).strip()
+                if len(speaker) <= 20:
+                    participants.add(speaker.title())
+        
+        # One scan for all meeting keywords; most lines have none and skip the specific checks
+        has_keyword = _MEETING_KEYWORD_HINT_RE.search(line_lower) is not None
+        
+        # Decisions and action items (bracketed lines included)
+        if has_keyword:
+            if _DECISION_LINE_RE.search(line_lower):
+                decisions.append(line)
+            elif _ACTION_LINE_RE.search(line_lower):
+                action_items.append(line)
+        
+        # Timestamp lines ("[00:01:23] ...") don't feed topics or speaker counts
+        if line[0] == '[':
+            continue
+        
+        # Detect new discussion topics
+        if has_keyword and _DISCUSSION_TRIGGER_RE.search(line_lower):
+            if current_topic:
+                discussions.append(' '.join(current_topic))
+            current_topic = [line]
+        elif current_topic:
+            current_topic.append(line)
+        
+        # Speaker counts (assumes format "Speaker: message")
+        speaker_part, separator, message_part = line.partition(':')
+        if separator:
+            speaker_part = speaker_part.strip()
+            message_part = message_part.strip()
+            
+            if speaker_part and len(speaker_part) < 50:  # Reasonable speaker name length
+                stats = speakers[speaker_part]
+                stats.total_words += len(message_part.split())
+                stats.total_messages += 1
                 
-            # Extract content based on section
-            if current_section in ['notes_tab_content', 'meeting_summary', 'transcript_tab_content', 'trello_board_review']:
-                # For tabs and summaries, capture all content as continuous text
-                if content[current_section]:
-                    content[current_section] += f"\n{line}"
-                else:
-                    content[current_section] = line
-            elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                if current_section in content and isinstance(content[current_section], list):
-                    content[current_section].append(line[1:].strip())
-            elif any(char.isdigit() and char in line[:3] for char in line[:3]):
-                if current_section in content and isinstance(content[current_section], list):
-                    content[current_section].append(line.strip())
-            elif current_section == 'general' and len(line) > 20:
-                content['key_points'].append(line)
+                # Count questions
+                if '?' in message_part:
+                    stats.questions_asked += 1
                 
-        return content
-        
-    except Exception as e:
-        print(f"Error extracting Google Doc content: {e}")
-        return None
+                # Count decision language
+                if has_keyword and _DECISION_LANGUAGE_RE.search(line_lower.partition(':')[2]):
+                    stats.decisions_made += 1
+    
+    if current_topic:
+        discussions.append(' '.join(current_topic))
+    
+    return {
+        'participants': sorted(participants),
+        'discussions': discussions,
+        'decisions': decisions,
+        'action_items': action_items,
+        'speakers': speakers
+    }
 
-def analyze_meeting_transcript(transcript, doc_content=None):
-    """Perform comprehensive AI analysis of meeting transcript and notes."""
+def analyze_meeting_transcript(transcript, doc_content=None, transcript_scan=None):
+    """Perform comprehensive AI analysis of meeting transcript and notes.
+    
+    Pass transcript_scan from scan_transcript_lines() to reuse an existing pass.
+    """
     try:
+        if transcript_scan is None:
+            transcript_scan = scan_transcript_lines(transcript)
+        
         analysis = {
-            'participants': [],
-            'key_discussions': [],
-            'decisions_made': [],
-            'action_items': [],
+            'participants': transcript_scan['participants'],
+            'key_discussions': transcript_scan['discussions'][:5],  # Top 5 discussions
+            'decisions_made': transcript_scan['decisions'],
+            'action_items': transcript_scan['action_items'],
             'meeting_purpose': '',
             'outcomes': [],
             'follow_ups': []
         }
         
-        # Extract participants
-        participants = extract_participants_fast(transcript)
-        analysis['participants'] = participants
-        
-        # Find key discussion points
-        lines = transcript.split('\n')
-        current_topic = ''
-        discussion_blocks = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line or '[' in line:
-                continue
-                
-            # Detect new topics
-            if any(keyword in line.lower() for keyword in ['discuss', 'talk about', 'review', 'look at']):
-                if current_topic:
-                    discussion_blocks.append(current_topic)
-                current_topic = line
-            elif current_topic:
-                current_topic += ' ' + line
-                
-        if current_topic:
-            discussion_blocks.append(current_topic)
-            
-        analysis['key_discussions'] = discussion_blocks[:5]  # Top 5 discussions
-        
-        # Extract decisions and outcomes
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in ['decided', 'agreed', 'resolved', 'concluded']):
-                analysis['decisions_made'].append(line.strip())
-            elif any(keyword in line_lower for keyword in ['will do', 'next step', 'follow up', 'action']):
-                analysis['action_items'].append(line.strip())
-        
         # Integrate Google Doc content if available
         if doc_content:
             analysis['meeting_purpose'] = ' '.join(doc_content.get('objectives', []))[:200]
@@ -1908,69 +2677,18 @@ def analyze_meeting_transcript(transcript, doc_content=None):
             'follow_ups': []
         }
 
-def calculate_speaker_metrics(transcript):
-    """Calculate detailed speaking metrics for each participant."""
+def calculate_speaker_metrics(transcript, transcript_scan=None):
+    """Calculate detailed speaking metrics for each participant.
+    
+    Pass transcript_scan from scan_transcript_lines() to reuse an existing pass.
+    """
     try:
-        metrics = {}
-        lines = transcript.split('\n')
-        current_speaker = None
+        if transcript_scan is None:
+            transcript_scan = scan_transcript_lines(transcript)
+        speakers = transcript_scan['speakers']
         
-        for line in lines:
-            line = line.strip()
-            if not line or '[' in line:
-                continue
-                
-            # Extract speaker name (assumes format "Speaker: message")
-            if ':' in line:
-                speaker_part = line.split(':', 1)[0].strip()
-                message_part = line.split(':', 1)[1].strip()
-                
-                if speaker_part and len(speaker_part) < 50:  # Reasonable speaker name length
-                    current_speaker = speaker_part
-                    
-                    if current_speaker not in metrics:
-                        metrics[current_speaker] = {
-                            'total_words': 0,
-                            'total_messages': 0,
-                            'avg_message_length': 0,
-                            'questions_asked': 0,
-                            'decisions_made': 0,
-                            'engagement_score': 0
-                        }
-                    
-                    word_count = len(message_part.split())
-                    metrics[current_speaker]['total_words'] += word_count
-                    metrics[current_speaker]['total_messages'] += 1
-                    
-                    # Count questions
-                    if '?' in message_part:
-                        metrics[current_speaker]['questions_asked'] += 1
-                    
-                    # Count decision language
-                    if any(word in message_part.lower() for word in ['decide', 'agree', 'resolve', 'conclude']):
-                        metrics[current_speaker]['decisions_made'] += 1
-        
-        # Calculate derived metrics
-        total_words = sum(m['total_words'] for m in metrics.values())
-        
-        for speaker, data in metrics.items():
-            if data['total_messages'] > 0:
-                data['avg_message_length'] = round(data['total_words'] / data['total_messages'], 1)
-            
-            if total_words > 0:
-                data['participation_percentage'] = round((data['total_words'] / total_words) * 100, 1)
-            else:
-                data['participation_percentage'] = 0
-                
-            # Engagement score (0-100)
-            engagement = 0
-            engagement += min(data['participation_percentage'] * 2, 40)  # Speaking participation (max 40)
-            engagement += min(data['questions_asked'] * 10, 30)  # Questions (max 30)
-            engagement += min(data['decisions_made'] * 15, 30)  # Decision-making (max 30)
-            
-            data['engagement_score'] = min(round(engagement), 100)
-        
-        return metrics
+        total_words = sum(stats.total_words for stats in speakers.values())
+        return {speaker: stats.as_metrics(total_words) for speaker, stats in speakers.items()}
         
     except Exception as e:
         print(f"Error calculating speaker metrics: {e}")
@@ -2039,10 +2757,18 @@ def generate_participant_feedback(speaker_data, transcript):
         print(f"Error generating participant feedback: {e}")
         return {}
 
+@lru_cache(maxsize=4)
+def _formatted_date(fmt, minute):
+    return datetime.now().strftime(fmt)
+
+def today_string(fmt):
+    """Today's date as datetime.now().strftime(fmt), formatted at most once a minute."""
+    return _formatted_date(fmt, int(time.time() // 60))
+
 def create_comprehensive_summary(transcript, doc_content=None, assignments=None):
     """Create concise meeting summary with key points only."""
     try:
-        today = datetime.now().strftime('%d/%m/%Y')
+        today = today_string('%d/%m/%Y')
         
         # Check if we have Notes tab content - prioritize this for group summary
         if doc_content and doc_content.get('notes_tab_content'):
@@ -2071,140 +2797,169 @@ def create_comprehensive_summary(transcript, doc_content=None, assignments=None)
         
     except Exception as e:
         print(f"Error creating summary: {e}")
-        today = datetime.now().strftime('%d/%m/%Y')
+        today = today_string('%d/%m/%Y')
         return f"""🎯 Meeting Summary - {today}
 
 📋 Meeting completed successfully
 ✅ Team members notified of updates"""
 
-def generate_meeting_comment(transcript_text, card_name, match_context="", card_id=None, doc_content=None, meeting_analysis=None):
-    """Generate enhanced structured comment for Trello card using meeting structure parsing."""
+# Fixed sections of the per-card meeting comment (each ends with its blank line)
+NO_DISCUSSION_COMMENT_BLOCK = (
+    "**💬 Discussion Status:**\n"
+    "> This card was mentioned in the meeting but no specific discussion was captured.\n"
+    "> Please check with the team for any updates or decisions made.\n"
+)
+ACTION_REQUIRED_COMMENT_BLOCK = (
+    "**🔄 Action Required:**\n"
+    "Please update this card with:\n"
+    "• Current status and progress\n"
+    "• Next steps and timeline\n"
+    "• Any blockers or support needed\n"
+    "\n"
+    "---\n"
+    "*Auto-generated from Google Meet transcript analysis*"
+)
+
+def _confidence_emoji(confidence):
+    return "🎯" if confidence >= 85 else "📝" if confidence >= 70 else "💭"
+
+def generate_meeting_comment(transcript_text, card_name, match_context="", card_id=None, doc_content=None, meeting_analysis=None, board_checklists=None, last_commenters=None, card_discussion=None):
+    """Generate enhanced structured comment for Trello card using meeting structure parsing.
+    
+    card_discussion is this card's entry from extract_matched_card_discussions; when
+    omitted the transcript is parsed for this card alone.
+    """
     try:
-        from meeting_parser import MeetingStructureParser
-        
-        # Use the new meeting parser to get card-specific discussion
-        parser = MeetingStructureParser()
-        
-        # Create a mock card list with just this card for parsing
-        mock_cards = [{'name': card_name}]
-        card_discussions = parser.extract_card_discussions(transcript_text, mock_cards)
+        if card_discussion is None:
+            # Use the meeting parser with a mock card list of just this card
+            card_discussion = extract_matched_card_discussions(transcript_text, [{'name': card_name}]).get(card_name, {})
         
-        # Get the specific discussion for this card
-        card_discussion = card_discussions.get(card_name, {})
         relevant_discussion = card_discussion.get('discussion', '')
         discussion_summary = card_discussion.get('summary', '')
         discussion_speakers = card_discussion.get('speakers', [])
         parser_confidence = card_discussion.get('confidence', 0)
         
+        # Significant words of the card name, shared by the context and doc checks below
+        card_keywords = frozenset(word for word in card_name.lower().split() if len(word) > 3)
+        
         # Get enhanced assignment information
-        assignment_info = []
+        assignment_block = None
         if card_id:
             try:
                 # Create a mock card object for assignment detection
-                class MockCard:
-                    def __init__(self, card_id, name, description=""):
-                        self.id = card_id
-                        self.name = name
-                        self.description = description
-                
-                mock_card = MockCard(card_id, card_name, "")
-                assigned_user, assigned_whatsapp, all_assignments = get_enhanced_card_assignment(mock_card, transcript_text)
+                mock_card = MockCard(card_id, card_name)
+                assigned_user, assigned_whatsapp, all_assignments = get_enhanced_card_assignment(
+                    mock_card, transcript_text, board_checklists, last_commenters)
                 
                 if all_assignments:
-                    assignment_info.append("**🎯 Assignment Analysis:**")
-                    for i, assignment in enumerate(all_assignments[:3], 1):  # Top 3 assignments
-                        confidence_emoji = "🎯" if assignment['confidence'] >= 85 else "📝" if assignment['confidence'] >= 70 else "💭"
-                        assignment_info.append(f"{confidence_emoji} **{assignment['name']}** - {assignment['source']} ({assignment['confidence']}% confidence)")
-                    assignment_info.append("")
+                    assignment_block = "**🎯 Assignment Analysis:**\n" + "\n".join(
+                        f"{_confidence_emoji(assignment['confidence'])} **{assignment['name']}** - {assignment['source']} ({assignment['confidence']}% confidence)"
+                        for assignment in all_assignments[:3]  # Top 3 assignments
+                    ) + "\n"
                     
                     # Highlight primary assignee
                     if assigned_user:
-                        assignment_info.append(f"**📌 Primary Assignee:** {assigned_user}")
-                        assignment_info.append("")
+                        assignment_block += f"\n**📌 Primary Assignee:** {assigned_user}\n"
                         
             except Exception as e:
                 print(f"Error in assignment detection for comment: {e}")
         
-        # Extract relevant meeting context
-        context_info = []
-        if meeting_analysis:
-            # Add meeting purpose if relevant to this card
-            if meeting_analysis.get('meeting_purpose') and any(word in meeting_analysis['meeting_purpose'].lower() for word in card_name.lower().split() if len(word) > 3):
-                context_info.append(f"**📋 Meeting Context:** {meeting_analysis['meeting_purpose']}")
-                context_info.append("")
-        
-        # Build the comment
-        comment_parts = []
-        
-        # Header
-        today = datetime.now().strftime('%B %d, %Y')
-        comment_parts.append(f"📅 **Meeting Update - {today}**")
-        comment_parts.append("")
+        # Build the comment one section at a time; every section ends with a blank line
+        today = today_string('%B %d, %Y')
+        comment_parts = [f"📅 **Meeting Update - {today}**\n"]
         
         # Assignment information
-        if assignment_info:
-            comment_parts.extend(assignment_info)
+        if assignment_block:
+            comment_parts.append(assignment_block)
         
-        # Meeting context
-        if context_info:
-            comment_parts.extend(context_info)
+        # Meeting context, if the meeting purpose is relevant to this card
+        if meeting_analysis:
+            purpose_lower = (meeting_analysis.get('meeting_purpose') or '').lower()
+            if card_keywords and any(word in purpose_lower for word in card_keywords):
+                comment_parts.append(f"**📋 Meeting Context:** {meeting_analysis['meeting_purpose']}\n")
         
         # Card-specific discussion from meeting parser
         if relevant_discussion and parser_confidence > 50:
-            comment_parts.append("**💬 Card-Specific Discussion:**")
+            discussion_block = ["**💬 Card-Specific Discussion:**"]
             if discussion_speakers:
-                comment_parts.append(f"*Participants: {', '.join(discussion_speakers)}*")
-            comment_parts.append("")
+                discussion_block.append(f"*Participants: {', '.join(discussion_speakers)}*")
+            discussion_block.append("")
             
             # Use the structured summary if available
             if discussion_summary:
-                comment_parts.append(discussion_summary)
+                discussion_block.append(discussion_summary)
             else:
-                # Fallback to raw discussion with formatting
-                discussion_lines = relevant_discussion.split('\n')
-                for line in discussion_lines[:4]:  # Limit to first 4 lines
-                    if line.strip():
-                        comment_parts.append(f"> {line}")
-            comment_parts.append("")
+                # Fallback to raw discussion with formatting, first 4 lines only
+                discussion_block.extend(f"> {line}" for line in relevant_discussion.split('\n')[:4] if line.strip())
+            discussion_block.append("")
+            comment_parts.append("\n".join(discussion_block))
         elif not relevant_discussion and parser_confidence < 30:
             # No specific discussion found for this card
-            comment_parts.append("**💬 Discussion Status:**")
-            comment_parts.append("> This card was mentioned in the meeting but no specific discussion was captured.")
-            comment_parts.append("> Please check with the team for any updates or decisions made.")
-            comment_parts.append("")
+            comment_parts.append(NO_DISCUSSION_COMMENT_BLOCK)
         
         # Google Doc insights (Notes tab content should be used here in future)
         if doc_content:
-            card_keywords = [word for word in card_name.lower().split() if len(word) > 3]
-            doc_insights = []
             # Check if any doc content relates to this card
+            doc_insights = []
             for key_point in doc_content.get('key_points', [])[:2]:
-                if any(keyword in key_point.lower() for keyword in card_keywords):
+                key_point_lower = key_point.lower()
+                if any(keyword in key_point_lower for keyword in card_keywords):
                     doc_insights.append(key_point)
             
             if doc_insights:
-                comment_parts.append("**📄 Additional Notes:**")
-                for insight in doc_insights:
-                    comment_parts.append(f"• {insight}")
-                comment_parts.append("")
-        
-        # Action required
-        comment_parts.append("**🔄 Action Required:**")
-        comment_parts.append("Please update this card with:")
-        comment_parts.append("• Current status and progress")
-        comment_parts.append("• Next steps and timeline")
-        comment_parts.append("• Any blockers or support needed")
-        comment_parts.append("")
-        
-        # Footer
-        comment_parts.append("---")
-        comment_parts.append("*Auto-generated from Google Meet transcript analysis*")
+                comment_parts.append("**📄 Additional Notes:**\n" + "".join(f"• {insight}\n" for insight in doc_insights))
+        
+        # Action required and footer
+        comment_parts.append(ACTION_REQUIRED_COMMENT_BLOCK)
         
         return "\n".join(comment_parts)
         
     except Exception as e:
         print(f"Error generating enhanced comment: {e}")
-        return f"📅 Meeting Update - {datetime.now().strftime('%B %d, %Y')}\n\nThis card was discussed in today's team meeting. Enhanced assignment detection encountered an error.\n\nPlease update with current status and confirm assignment.\n\n---\n*Auto-generated from meeting transcript*"
+        return f"📅 Meeting Update - {today_string('%B %d, %Y')}\n\nThis card was discussed in today's team meeting. Enhanced assignment detection encountered an error.\n\nPlease update with current status and confirm assignment.\n\n---\n*Auto-generated from meeting transcript*"
+
+def analyze_transcript_sentiment(transcript_text):
+    """Run the EnhancedAI sentiment pass; returns the entries to add to analysis_results."""
+    try:
+        from enhanced_ai import EnhancedAI
+        ai_engine = EnhancedAI()
+        
+        # Only do essential AI analysis to avoid timeouts
+        sentiment_result = ai_engine.analyze_meeting_sentiment(transcript_text)
+        print(f"AI analysis completed")
+        return {
+            'sentiment_analysis': {
+                'summary': sentiment_result.summary,
+                'insights': sentiment_result.insights,
+                'confidence': sentiment_result.confidence
+            }
+        }
+        
+    except Exception as e:
+        print(f"AI analysis failed: {e}")
+        return {'enhanced_ai_error': str(e)}
+
+def history_text_fields(name, text):
+    """Preview, length and SHA-256 of a long text, for records kept in app_data history."""
+    text = text or ''
+    return {
+        f'{name}_preview': text[:HISTORY_TEXT_PREVIEW_CHARS],
+        f'{name}_length': len(text),
+        f'{name}_sha256': hashlib.sha256(text.encode('utf-8')).hexdigest()
+    }
+
+def doc_content_for_history(doc_content):
+    """Copy of extract_google_doc_content output with the raw text and tab sections cut to previews."""
+    if not doc_content:
+        return doc_content
+    
+    trimmed = {}
+    for key, value in doc_content.items():
+        if key == 'raw_text' or key in DOC_TEXT_SECTIONS:
+            trimmed.update(history_text_fields(key, value))
+        else:
+            trimmed[key] = value
+    return trimmed
 
 @app.route('/api/process-transcript', methods=['POST'])
 @login_required
@@ -2261,18 +3016,16 @@ def process_transcript():
             return jsonify({'success': False, 'error': 'No transcript source provided. Use "url" or "direct_text".'})
         
         print(f"Transcript received: {len(transcript_text)} characters from {source_type}")
+        word_count = len(transcript_text.split())  # shared by the summary and the response
         
-        # Safe preview of transcript content  
-        try:
-            safe_preview = transcript_text[:200].encode('ascii', errors='replace').decode('ascii')
-            print(f"First 200 characters: {safe_preview}...")
-        except Exception as e:
-            print(f"First 200 characters: [contains special characters] - {e}")
+        # Preview of transcript content
+        print(f"First 200 characters: {transcript_text[:200]}...")
             
         # Safe word detection
         try:
-            text_lower = transcript_text.lower() if transcript_text else ""
-            print(f"Contains common words: Mobile={('mobile' in text_lower)}, App={('app' in text_lower)}, Center={('center' in text_lower)}, Court={('court' in text_lower)}")
+            word_flags = ', '.join(f"{label}={pattern.search(transcript_text) is not None}"
+                                   for label, pattern in _COMMON_WORD_PATTERNS)
+            print(f"Contains common words: {word_flags}")
         except Exception as e:
             print(f"Word detection failed: {e}")
         
@@ -2280,6 +3033,7 @@ def process_transcript():
         analysis_results = {}
         doc_content = None
         meeting_analysis = None
+        transcript_scan = None
         speaker_metrics = {}
         participant_feedback = {}
         
@@ -2304,16 +3058,13 @@ def process_transcript():
             
             # DEBUG: Show sample content
             if doc_content.get('trello_board_review'):
-                try:
-                    sample = doc_content['trello_board_review'][:300].encode('ascii', errors='replace').decode('ascii')
-                    print(f"DEBUG Trello Review sample: {sample}...")
-                except:
-                    print(f"DEBUG Trello Review length: {len(doc_content['trello_board_review'])}")
+                print(f"DEBUG Trello Review sample: {doc_content['trello_board_review'][:300]}...")
         
         # NEW: Comprehensive meeting analysis
         try:
             print("Performing comprehensive meeting analysis...")
-            meeting_analysis = analyze_meeting_transcript(transcript_text, doc_content)
+            transcript_scan = scan_transcript_lines(transcript_text)
+            meeting_analysis = analyze_meeting_transcript(transcript_text, doc_content, transcript_scan)
             analysis_results['meeting_analysis'] = {
                 'participants': len(meeting_analysis.get('participants', [])),
                 'key_discussions': len(meeting_analysis.get('key_discussions', [])),
@@ -2329,7 +3080,7 @@ def process_transcript():
         # NEW: Speaker metrics and participation analysis
         try:
             print("Calculating speaker metrics...")
-            speaker_metrics = calculate_speaker_metrics(transcript_text)
+            speaker_metrics = calculate_speaker_metrics(transcript_text, transcript_scan)
             if speaker_metrics:
                 analysis_results['speaker_metrics'] = {
                     speaker: {
@@ -2364,23 +3115,11 @@ def process_transcript():
                 print(f"Legacy speaker analysis failed: {e}")
                 analysis_results['legacy_speaker_analysis'] = {'error': str(e)}
         
-        # Fast AI analysis with timeout protection
-        try:
-            from enhanced_ai import EnhancedAI
-            ai_engine = EnhancedAI()
-            
-            # Only do essential AI analysis to avoid timeouts
-            sentiment_result = ai_engine.analyze_meeting_sentiment(transcript_text)
-            analysis_results['sentiment_analysis'] = {
-                'summary': sentiment_result.summary,
-                'insights': sentiment_result.insights,
-                'confidence': sentiment_result.confidence
-            }
-            print(f"AI analysis completed")
-            
-        except Exception as e:
-            print(f"AI analysis failed: {e}")
-            analysis_results['enhanced_ai_error'] = str(e)
+        # Fast AI analysis runs in the background while cards are matched below;
+        # the OpenAI call and the Trello lookups are independent network waits
+        ai_executor = ThreadPoolExecutor(max_workers=1)
+        sentiment_future = ai_executor.submit(analyze_transcript_sentiment, transcript_text)
+        ai_executor.shutdown(wait=False)
         
         # Enhanced card matching: Notes → Transcript workflow with non-OpenAI backup
         matched_cards = []
@@ -2413,6 +3152,22 @@ def process_transcript():
             except:
                 matched_cards = []
         
+        analysis_results.update(sentiment_future.result())
+        
+        # Fetch checklists for all matched cards' boards once, rather than per card,
+        # and last commenters concurrently before any of our own comments are posted
+        board_checklists = {}
+        last_commenters = {}
+        if matched_cards:
+            board_checklists = get_matched_cards_checklists(matched_cards[:10])
+            last_commenters = get_last_non_admin_commenter_batch(
+                card_match.get('id') for card_match in matched_cards[:10])
+        
+        # One meeting-parser pass over the transcript for every card we comment on
+        card_discussions = {}
+        if matched_cards and trello_client:
+            card_discussions = extract_matched_card_discussions(transcript_text, matched_cards[:5])
+        
         # Add comments to matched cards (NEW FEATURE)
         comments_posted = 0
         comment_errors = []
@@ -2421,13 +3176,11 @@ def process_transcript():
             try:
                 print("Adding comments to matched cards...")
                 
-                for card_match in matched_cards[:5]:  # Limit to top 5 matches
-                    card_id = card_match.get('id')
+                def post_card_comment(card_match):
+                    """Generate and post one card's comment; returns (comment_text, success, error)."""
+                    card_id = card_match['id']
                     card_name = card_match.get('name', 'Unknown')
                     
-                    if not card_id:
-                        continue
-                    
                     # Generate enhanced comment with comprehensive analysis
                     comment_text = generate_meeting_comment(
                         transcript_text, 
@@ -2435,25 +3188,39 @@ def process_transcript():
                         card_match.get('context', ''),
                         card_id,  # Pass card_id for enhanced assignment detection
                         doc_content,  # Pass Google Doc content for richer context
-                        meeting_analysis  # Pass meeting analysis for better insights
+                        meeting_analysis,  # Pass meeting analysis for better insights
+                        board_checklists,
+                        last_commenters,
+                        card_discussions.get(card_name, {})
                     )
                     
                     # Post comment
                     try:
-                        success = trello_client.add_comment_to_card(card_id, comment_text)
-                        if success:
-                            comments_posted += 1
-                            print(f"Added comment to card: {card_name}")
-                            # Add comment status to card match
-                            card_match['comment_posted'] = True
-                            card_match['comment_text'] = comment_text
-                        else:
-                            comment_errors.append(f"Failed to post comment to {card_name}")
-                            card_match['comment_posted'] = False
+                        return comment_text, trello_client.add_comment_to_card(card_id, comment_text), None
                     except Exception as comment_error:
+                        return comment_text, False, comment_error
+                
+                # Each post is an independent Trello round-trip, so post them concurrently;
+                # results are recorded here, in match order, on the request thread
+                cards_to_comment = [card_match for card_match in matched_cards[:5] if card_match.get('id')]  # Limit to top 5 matches
+                with ThreadPoolExecutor(max_workers=5) as executor:
+                    post_results = list(executor.map(with_card_lookups(post_card_comment), cards_to_comment))
+                
+                for card_match, (comment_text, success, comment_error) in zip(cards_to_comment, post_results):
+                    card_name = card_match.get('name', 'Unknown')
+                    if comment_error is not None:
                         comment_errors.append(f"Error posting to {card_name}: {str(comment_error)}")
                         card_match['comment_posted'] = False
                         print(f"Error posting comment to {card_name}: {comment_error}")
+                    elif success:
+                        comments_posted += 1
+                        print(f"Added comment to card: {card_name}")
+                        # Add comment status to card match
+                        card_match['comment_posted'] = True
+                        card_match['comment_text'] = comment_text
+                    else:
+                        comment_errors.append(f"Failed to post comment to {card_name}")
+                        card_match['comment_posted'] = False
                 
                 print(f"Posted {comments_posted} comments to Trello cards")
                 
@@ -2475,14 +3242,9 @@ def process_transcript():
                 
                 if card_id:
                     # Create mock card for assignment detection
-                    class MockCard:
-                        def __init__(self, card_id, name):
-                            self.id = card_id
-                            self.name = name
-                            self.description = ""
-                    
                     mock_card = MockCard(card_id, card_name)
-                    assigned_user, assigned_whatsapp, all_assignments = get_enhanced_card_assignment(mock_card, transcript_text)
+                    assigned_user, assigned_whatsapp, all_assignments = get_enhanced_card_assignment(
+                        mock_card, transcript_text, board_checklists, last_commenters)
                     
                     if assigned_user:
                         card_assignments[card_name] = {
@@ -2498,16 +3260,19 @@ def process_transcript():
                 card_assignments
             )
             
-            # Legacy summary data for compatibility
-            participants = extract_participants_fast(transcript_text)
+            # Legacy summary data for compatibility (participants come from the analysis pass when it ran)
+            if transcript_scan is not None:
+                participants = list(transcript_scan['participants'])
+            else:
+                participants = extract_participants_fast(transcript_text)
             action_items = extract_action_items_fast(transcript_text)
             
             summary_data = {
                 'comprehensive_summary': group_message_summary,
                 'participants': participants,
                 'action_items': action_items,
-                'word_count': len(transcript_text.split()),
-                'meeting_duration_estimate': estimate_duration_fast(transcript_text),
+                'word_count': word_count,
+                'meeting_duration_estimate': estimate_duration_fast(transcript_text, word_count),
                 'comments_posted': comments_posted,
                 'comment_errors': comment_errors,
                 'card_assignments': card_assignments,
@@ -2532,8 +3297,9 @@ def process_transcript():
             'matched_cards': matched_cards,
             'speaker_metrics': speaker_metrics,
             'participant_feedback': participant_feedback,
-            'doc_content': doc_content,
-            'meeting_analysis': meeting_analysis
+            'doc_content': doc_content_for_history(doc_content),
+            'meeting_analysis': meeting_analysis,
+            **history_text_fields('transcript', transcript_text)
         })
         
         total_time = time.time() - start_time
@@ -2545,7 +3311,7 @@ def process_transcript():
             'message': f'Transcript processed successfully. Posted {comments_posted} comments to Trello cards.',
             'source_type': source_type,
             'source_url': source_url,
-            'word_count': len(transcript_text.split()),
+            'word_count': word_count,
             'analysis_results': analysis_results,
             'summary': summary_data,
             'matched_cards': matched_cards,
@@ -2576,14 +3342,14 @@ def process_transcript():
 def extract_participants_fast(transcript_text):
     """Fast participant extraction."""
     participants = set()
-    lines = transcript_text.split('\n')
+    lines = transcript_text.split('\n', 50)[:50]  # Limit to first 50 lines for speed
     
-    for line in lines[:50]:  # Limit to first 50 lines for speed
+    for line in lines:
         line = line.strip()
         if not line:
             continue
         
-        speaker_match = re.match(r'^([A-Za-z][A-Za-z\s]+?):\s*(.+)$', line)
+        speaker_match = _PARTICIPANT_LINE_RE.match(line)
         if speaker_match:
             speaker = speaker_match.group(1).strip()
             if len(speaker) <= 20:
@@ -2597,21 +3363,15 @@ def extract_participants_fast(transcript_text):
 def extract_action_items_fast(transcript_text):
     """Fast action item extraction."""
     action_items = []
-    lines = transcript_text.split('\n')
-    
-    action_patterns = [
-        r'(\w+)\s+(?:will|should|must)\s+([^.!?]+)',
-        r'(\w+)\s+is\s+going\s+to\s+([^.!?]+)',
-        r'(\w+)\s+can\s+(?:take|handle)\s+([^.!?]+)'
-    ]
+    lines = transcript_text.split('\n', 100)[:100]  # Limit for speed; don't split the rest
     
-    for line in lines[:100]:  # Limit for speed
+    for line in lines:
         line = line.strip()
-        if not line:
+        if not line or not _ACTION_ITEM_HINT_RE.search(line):
             continue
         
-        for pattern in action_patterns:
-            matches = re.findall(pattern, line, re.IGNORECASE)
+        for pattern in _ACTION_ITEM_PATTERNS:
+            matches = pattern.findall(line)
             for match in matches:
                 if isinstance(match, tuple) and len(match) >= 2:
                     action_items.append({
@@ -2624,9 +3384,10 @@ def extract_action_items_fast(transcript_text):
     
     return action_items
 
-def estimate_duration_fast(transcript_text):
-    """Fast duration estimation."""
-    word_count = len(transcript_text.split())
+def estimate_duration_fast(transcript_text, word_count=None):
+    """Fast duration estimation. Pass word_count if the caller already has it."""
+    if word_count is None:
+        word_count = len(transcript_text.split())
     estimated_minutes = max(5, word_count // 150)  # 150 words per minute
     
     return {
@@ -2717,15 +3478,7 @@ def get_recent_activity():
             return jsonify({'success': False, 'error': 'Trello client not available'})
         
         # Get only the EEInteractive board
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
-        
-        for board in boards:
-            if board.closed:
-                continue
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        eeinteractive_board = _get_fresh_eeinteractive_board()
         
         if not eeinteractive_board:
             return jsonify({'success': False, 'error': 'EEInteractive board not found'})
@@ -2733,12 +3486,11 @@ def get_recent_activity():
         activities = []
         
         # Get recent actions from the board
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.now() - timedelta(days=days)
+        # Trello timestamps are UTC ('Z'), so compare against an aware UTC cutoff
+        cutoff_utc = datetime.now(timezone.utc) - timedelta(days=days)
         
         try:
             # Use the Trello client API directly to get actions
-            import requests
             board_id = eeinteractive_board.id
             url = f"https://api.trello.com/1/boards/{board_id}/actions"
             params = {
@@ -2748,13 +3500,13 @@ def get_recent_activity():
                 'filter': 'all'
             }
             
-            response = requests.get(url, params=params)
-            board_actions = response.json() if response.status_code == 200 else []
+            response = _http.get(url, params=params, timeout=10)
+            board_actions = json_loads(response.content) if response.status_code == 200 else []
             
             for action in board_actions:
                 action_date = datetime.fromisoformat(action['date'].replace('Z', '+00:00'))
                 
-                if action_date < cutoff_date.replace(tzinfo=action_date.tzinfo):
+                if action_date < cutoff_utc:
                     continue
                 
                 activity = {
@@ -2833,7 +3585,7 @@ def get_recent_activity():
                 try:
                     if card.date_last_activity:
                         activity_date = datetime.fromisoformat(card.date_last_activity.replace('Z', '+00:00'))
-                        if activity_date >= cutoff_date.replace(tzinfo=activity_date.tzinfo):
+                        if activity_date >= cutoff_utc:
                             activities.append({
                                 'date': card.date_last_activity,
                                 'type': 'card_activity',
@@ -2856,38 +3608,179 @@ def get_recent_activity():
         print(f"Error getting recent activity: {e}")
         return jsonify({'success': False, 'error': str(e)})
 
+@lru_cache(maxsize=64)
+def comment_assignment_re(member_lower):
+    """Compiled search for a lowercased member being handed a card in a lowercased comment."""
+    name = re.escape(member_lower)
+    return re.compile(
+        rf'@{name}|assign this to {name}|assigned to {name}'
+        rf'|{name} (?:please|can you|take this|handle this)'
+    )
+
+# Smart-default owners by card content, checked in order: (keywords, member, label).
+# Each keyword list is one compiled alternation, so a card is scanned once per rule.
+# Automation work has no owner since Ezechiel left the team.
+_SMART_DEFAULT_RULES = tuple(
+    (re.compile('|'.join(keywords)), member, label) for keywords, member, label in (
+        (('mobile', 'app', 'ios', 'android'), 'Wendy', 'Mobile/App'),
+        (('website', 'web', 'wordpress', 'landing', 'page'), 'Lancey', 'Website'),
+        (('design', 'logo', 'brand', 'graphics'), 'Breyden', 'Design'),
+        (('automation', 'integration', 'api', 'webhook'), None, 'Automation'),
+    )
+)
+
+# Words that mark an assignee's comment as a real progress update
+_UPDATE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, (
+    'progress', 'completed', 'working on', 'finished', 'done', 'update', 'status', 'started',
+    'implementing', 'fixed', 'issue', 'blocker', 'challenge', 'estimate', 'timeline', 'percentage', '%'
+))), re.IGNORECASE)
+
+def _assignee_from_text(card_name_lower, card_description, assignable_members):
+    """Method 1: a team member named in the card description or name."""
+    for member_name, whatsapp_num, member_lower in assignable_members:
+        # Check in description: "@wendy", "assigned to wendy", "wendy will" etc.
+        # all contain the name, so one substring check covers every pattern
+        if member_lower in card_description:
+            log.debug("FOUND: Assigned user in description: %s", member_name)
+            return member_name, whatsapp_num
+        
+        # Also check card name for assignments
+        if member_lower in card_name_lower:
+            log.debug("FOUND: Assigned user in card name: %s", member_name)
+            return member_name, whatsapp_num
+    return None
+
+def _assignee_from_trello_members(card, team_members_lower):
+    """Method 2: a Trello card member who matches a team member (partial matching)."""
+    try:
+        card_members = getattr(card, 'members', [])
+        log.debug("  MEMBERS: Found %s Trello members", len(card_members))
+        
+        for member in card_members:
+            member_name_lower = member.full_name.lower()
+            log.debug("    Trello member: %s", member.full_name)
+            
+            # Skip admin and Criselle
+            if 'admin' in member_name_lower or 'criselle' in member_name_lower:
+                log.debug("      SKIP: admin/criselle member")
+                continue
+            
+            for team_member_name, whatsapp_num, team_member_lower in team_members_lower:
+                if team_member_lower in member_name_lower or member_name_lower in team_member_lower:
+                    log.debug("FOUND: Assigned user from Trello members: %s", team_member_name)
+                    return team_member_name, whatsapp_num
+    except Exception as e:
+        log.debug("  MEMBERS: Could not access Trello members: %s", e)
+    return None
+
+def _assignee_from_enhanced_tracker(card):
+    """Method 2.5: the enhanced tracker's sophisticated assignee detection (3 second limit)."""
+    log.debug("  ENHANCED DETECTION: Using sophisticated assignee detection for card ID: %s", card.id)
+    try:
+        # Set a timeout for the enhanced detection
+        import signal
+        
+        def timeout_handler(signum, frame):
+            raise TimeoutError("Enhanced detection timed out")
+        
+        # Only on non-Windows systems
+        if hasattr(signal, 'SIGALRM'):
+            signal.signal(signal.SIGALRM, timeout_handler)
+            signal.alarm(3)  # 3 second timeout
+        
+        try:
+            assignee_result = enhanced_team_tracker.get_assignee_for_card(card.id)
+            if assignee_result and assignee_result['name']:
+                log.debug("FOUND: Enhanced tracker detected assignee: %s", assignee_result['name'])
+                return assignee_result['name'], assignee_result['whatsapp']
+        finally:
+            if hasattr(signal, 'SIGALRM'):
+                signal.alarm(0)  # Cancel the alarm
+                
+    except TimeoutError:
+        log.warning("  ENHANCED DETECTION: Timed out after 3 seconds")
+    except Exception as e:
+        log.warning("  ENHANCED DETECTION: Error: %s", e)
+    return None
+
+def _assignee_from_comments(card_comments, assignable_members):
+    """Method 3: a member handed the card in one of its last 5 comments."""
+    log.debug("  COMMENT ASSIGNMENT: Checking recent comments for assignments...")
+    try:
+        for comment in (card_comments or [])[:5]:
+            comment_text = comment.get('data', {}).get('text', '').lower()
+            
+            for team_member_name, whatsapp_num, member_lower in assignable_members:
+                pattern_match = comment_assignment_re(member_lower).search(comment_text)
+                if pattern_match:
+                    log.debug("FOUND: Assignment in comment '%s': %s", pattern_match.group(), team_member_name)
+                    return team_member_name, whatsapp_num
+    except Exception as e:
+        log.warning("  COMMENT ASSIGNMENT: Could not check comments: %s", e)
+    return None
+
+def _assignee_from_content(card_name_lower, card_description, team_members):
+    """Method 4: smart default owner for the kind of work the card describes."""
+    log.debug("  SMART DEFAULTS: Attempting to assign based on card content...")
+    card_content = f"{card_name_lower} {card_description}"
+    
+    # Only if the member exists in the current team; the first matching rule
+    # decides, even if its member isn't in the team
+    for keywords_re, default_member, label in _SMART_DEFAULT_RULES:
+        if not keywords_re.search(card_content):
+            continue
+        if default_member is None:
+            log.debug("SKIP: %s content (Ezechiel no longer in team)", label)
+        elif default_member in team_members:
+            log.debug("FOUND: %s content assigned to %s", label, default_member)
+            return default_member, team_members.get(default_member)
+        return None
+    return None
+
+def resolve_card_assignee(card, card_comments, team_members, team_members_lower, assignable_members,
+                          use_enhanced_detection=False):
+    """Return (name, whatsapp) for the card's assignee, or (None, None).
+    
+    Each method runs only if every earlier one found nobody.
+    """
+    card_description = (card.description or '').lower()
+    card_name_lower = card.name.lower()
+    log.debug("  DESCRIPTION: '%s...'", card_description[:100])
+    log.debug("  CARD NAME: '%s'", card_name_lower)
+    
+    return (_assignee_from_text(card_name_lower, card_description, assignable_members)
+            or _assignee_from_trello_members(card, team_members_lower)
+            or (use_enhanced_detection and _assignee_from_enhanced_tracker(card))
+            or _assignee_from_comments(card_comments, assignable_members)
+            or _assignee_from_content(card_name_lower, card_description, team_members)
+            or (None, None))
+
 @app.route('/api/scan-cards', methods=['POST'])
 @login_required
 def scan_cards():
     """Scan Trello cards for team tracker - EEInteractive board only, DOING/IN PROGRESS lists."""
-    print("=== SCAN CARDS ROUTE CALLED ===")
+    log.info("=== SCAN CARDS ROUTE CALLED ===")
     try:
         # Check if force refresh requested and scan mode
         data = request.get_json() or {}
         force_refresh = data.get('force_refresh', False)
         scan_all_lists = data.get('scan_all', False)  # Option to scan all lists
         
-        print(f"=== SCANNING TRELLO CARDS FOR TEAM TRACKER (force_refresh={force_refresh}) ===")
+        log.info("=== SCANNING TRELLO CARDS FOR TEAM TRACKER (force_refresh=%s) ===", force_refresh)
         start_time = time.time()
         
         # If force refresh, clear ONLY team tracker cards (Gmail data preserved)
         if force_refresh and enhanced_team_tracker and enhanced_team_tracker.db:
-            print("FORCE REFRESH: Clearing ONLY team tracker cards (Gmail data preserved)")
+            log.info("FORCE REFRESH: Clearing ONLY team tracker cards (Gmail data preserved)")
             enhanced_team_tracker.db.clear_all_cards()  # This only clears team_tracker tables
+        if force_refresh:
+            invalidate_trello_cache()
         
         if not trello_client:
             return jsonify({'success': False, 'error': 'Trello client not available'})
         
         # Get only the EEInteractive board
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
-        
-        for board in boards:
-            if board.closed:
-                continue
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        eeinteractive_board = _get_fresh_eeinteractive_board()
         
         if not eeinteractive_board:
             return jsonify({'success': False, 'error': 'EEInteractive board not found'})
@@ -2901,25 +3794,25 @@ def scan_cards():
             # Full scan mode - get everything for complete history
             target_lists = [lst.id for lst in board_lists]
             active_lists = target_lists
-            print(f"FULL SCAN MODE: Scanning all {len(board_lists)} lists")
+            log.info("FULL SCAN MODE: Scanning all %s lists", len(board_lists))
         else:
             # Default mode - only scan active lists (DOING/IN PROGRESS)
             target_lists = []
             active_lists = []
             
-            print(f"Available lists on board:")
+            log.debug("Available lists on board:")
             for lst in board_lists:
-                print(f"  - {lst.name} (ID: {lst.id})")
+                log.debug("  - %s (ID: %s)", lst.name, lst.id)
                 list_name_lower = lst.name.lower()
                 
                 # Only scan DOING/IN PROGRESS lists by default
                 if 'doing' in list_name_lower or 'in progress' in list_name_lower or 'in-progress' in list_name_lower:
                     target_lists.append(lst.id)
                     active_lists.append(lst.id)
-                    print(f"TARGET: Will scan and track: {lst.name}")
+                    log.info("TARGET: Will scan and track: %s", lst.name)
             
             if not target_lists:
-                print("WARNING: No DOING/IN PROGRESS lists found, scanning all non-archived lists")
+                log.warning("WARNING: No DOING/IN PROGRESS lists found, scanning all non-archived lists")
                 excluded = ['done', 'completed', 'archive', 'archived']
                 for lst in board_lists:
                     if not any(keyword in lst.name.lower() for keyword in excluded):
@@ -2932,30 +3825,58 @@ def scan_cards():
         # Get cards from EEInteractive board only
         try:
             board_cards = eeinteractive_board.list_cards()
+            if not board_cards:
+                # An empty board usually means an API error or a stale board lookup
+                invalidate_trello_cache()
             total_cards = len(board_cards)
-            print(f"Total cards to process: {total_cards}")
+            log.info("Total cards to process: %s", total_cards)
         except Exception as e:
-            print(f"ERROR: Failed to get cards: {e}")
+            log.error("ERROR: Failed to get cards: %s", e)
             return jsonify({'success': False, 'error': f'Failed to get cards: {str(e)}'})
         
+        # Fetch comments for every card we'll process up front (one board-level request,
+        # or concurrent batches on busy boards) instead of one blocking request per card
+        # inside the loop (the newest 50, newest first)
+        prefetched_comments = {}
+        if TRELLO_API_KEY and TRELLO_TOKEN:
+            prefetched_comments = get_card_comments_batch(
+                (card.id for card in board_cards if not card.closed and card.list_id in target_lists),
+                board_id=eeinteractive_board.id)
+        
+        # Get current team members from enhanced tracker (database-first), with their
+        # lowercased names, once for the whole scan rather than per card
+        if enhanced_team_tracker:
+            current_team_members = enhanced_team_tracker.team_members
+            log.info("  ENHANCED TRACKER: Using %s database team members: %s", len(current_team_members), list(current_team_members.keys()))
+        else:
+            current_team_members = TEAM_MEMBERS
+            log.info("  FALLBACK: Using %s environment team members: %s", len(current_team_members), list(current_team_members.keys()))
+        team_members_lower = [(member_name, whatsapp_num, member_name.lower())
+                              for member_name, whatsapp_num in current_team_members.items()]
+        # Admin and Criselle are never assigned tasks
+        assignable_members = [member for member in team_members_lower if member[2] not in ('admin', 'criselle')]
+        
         # Process cards in batches to prevent timeouts
         BATCH_SIZE = 5  # Process 5 cards at a time
         processed_count = 0
         
+        # Trello timestamps are UTC ('Z'); one aware "now" serves every card and comment age
+        now_utc = datetime.now(timezone.utc)
+        
         for i, card in enumerate(board_cards):
             # Add a small delay every batch to prevent API rate limiting
             if i > 0 and i % BATCH_SIZE == 0:
-                print(f"Processed {i}/{total_cards} cards...")
+                log.info("Processed %s/%s cards...", i, total_cards)
                 time.sleep(0.2)  # Small delay
             
             try:  # Wrap each card processing in try-catch
                 if card.closed:
-                    print(f"SKIP: Closed card: {card.name}")
+                    log.debug("SKIP: Closed card: %s", card.name)
                     continue
                 
                 # Debug: Show which list each card is in
                 card_list_name = list_names.get(card.list_id, 'Unknown')
-                print(f"CARD: '{card.name}' is in list: {card_list_name}")
+                log.debug("CARD: '%s' is in list: %s", card.name, card_list_name)
                 
                 # Skip cards not in target lists
                 if card.list_id not in target_lists:
@@ -2965,22 +3886,21 @@ def scan_cards():
                 card_needs_tracking = card.list_id in active_lists
                 
                 if not card_needs_tracking:
-                    print(f"HISTORY: Card '{card.name}' in non-active list - minimal processing")
+                    log.debug("HISTORY: Card '%s' in non-active list - minimal processing", card.name)
                 
-                print(f"PROCESS: Processing card: {card.name}")
+                log.debug("PROCESS: Processing card: %s", card.name)
                 
                 # Calculate hours since last activity (general card activity)
                 hours_since_activity = 0
                 needs_update = False
                 try:
                     if card.date_last_activity:
-                        from datetime import datetime
-                        activity_date = datetime.fromisoformat(card.date_last_activity.replace('Z', '+00:00'))
-                        hours_since_activity = (datetime.now().replace(tzinfo=activity_date.tzinfo) - activity_date).total_seconds() / 3600
+                        activity_date = datetime.fromisoformat(card.date_last_activity)
+                        hours_since_activity = (now_utc - activity_date).total_seconds() / 3600
                     else:
                         hours_since_activity = 999  # Very high number
                 except Exception as e:
-                    print(f"Error parsing date for card {card.name}: {e}")
+                    log.warning("Error parsing date for card %s: %s", card.name, e)
                     hours_since_activity = 999
                 
                 # Extract assigned user from checklists and comments using enhanced tracker
@@ -2988,212 +3908,25 @@ def scan_cards():
                 assigned_whatsapp = None
                 
                 try:
-                    print(f"SEARCH: Looking for assigned user for card: {card.name}")
-                    
-                    # Get current team members from enhanced tracker (database-first)
-                    current_team_members = {}
-                    if enhanced_team_tracker:
-                        current_team_members = enhanced_team_tracker.team_members
-                        print(f"  ENHANCED TRACKER: Using {len(current_team_members)} database team members: {list(current_team_members.keys())}")
-                    else:
-                        current_team_members = TEAM_MEMBERS
-                        print(f"  FALLBACK: Using {len(current_team_members)} environment team members: {list(current_team_members.keys())}")
-                    
-                    # Method 1: Check card description for team member names and @mentions
-                    card_description = (card.description or '').lower()
-                    card_name_lower = card.name.lower()
-                    print(f"  DESCRIPTION: '{card_description[:100]}...'")
-                    print(f"  CARD NAME: '{card_name_lower}'")
-                    
-                    # Check for @mentions and direct name references
-                    for member_name, whatsapp_num in current_team_members.items():
-                        member_lower = member_name.lower()
-                        
-                        # Skip admin and criselle from being assigned tasks
-                        if member_lower in ['admin', 'criselle']:
-                            continue
-                    
-                    # Check various patterns:
-                    patterns_to_check = [
-                        f"@{member_lower}",  # @wendy
-                        f"@ {member_lower}",  # @ wendy  
-                        member_lower,  # wendy
-                        f"assigned to {member_lower}",  # assigned to wendy
-                        f"assign to {member_lower}",  # assign to wendy
-                        f"{member_lower} is",  # wendy is working on
-                        f"{member_lower} will",  # wendy will handle
-                        f"{member_lower} to",  # wendy to complete
-                    ]
-                    
-                    # Check in description
-                    for pattern in patterns_to_check:
-                        if pattern in card_description:
-                            assigned_user = member_name
-                            assigned_whatsapp = whatsapp_num
-                            print(f"FOUND: Assigned user in description pattern '{pattern}': {member_name}")
-                            break
-                    
-                    if assigned_user:
-                        break
-                    
-                    # Also check card name for assignments
-                    if member_lower in card_name_lower:
-                        assigned_user = member_name
-                        assigned_whatsapp = whatsapp_num
-                        print(f"FOUND: Assigned user in card name: {member_name}")
-                        break
-                    
-                    # Method 2: Check actual Trello card members
-                    if not assigned_user:
-                        try:
-                            card_members = getattr(card, 'members', [])
-                            print(f"  MEMBERS: Found {len(card_members)} Trello members")
-                            
-                            for member in card_members:
-                                member_name_lower = member.full_name.lower()
-                                print(f"    Trello member: {member.full_name}")
-                                
-                                # Skip admin and Criselle
-                                if 'admin' in member_name_lower or 'criselle' in member_name_lower:
-                                    print(f"      SKIP: admin/criselle member")
-                                    continue
-                                
-                                # Check if this member matches our team (partial matching)
-                                for team_member_name, whatsapp_num in current_team_members.items():
-                                    if team_member_name.lower() in member_name_lower or member_name_lower in team_member_name.lower():
-                                        assigned_user = team_member_name
-                                        assigned_whatsapp = whatsapp_num
-                                        print(f"FOUND: Assigned user from Trello members: {team_member_name}")
-                                        break
-                                if assigned_user:
-                                    break
-                                
-                        except Exception as e:
-                            print(f"  MEMBERS: Could not access Trello members: {e}")
-                    
-                    # Method 2.5: Use enhanced tracker's sophisticated assignee detection
-                    # Skip enhanced detection if we have too many cards to prevent timeouts
-                    USE_ENHANCED_DETECTION = total_cards < 30  # Only use for smaller boards
-                    
-                    if not assigned_user and enhanced_team_tracker and USE_ENHANCED_DETECTION and card_needs_tracking:
-                        print(f"  ENHANCED DETECTION: Using sophisticated assignee detection for card ID: {card.id}")
-                        try:
-                            # Set a timeout for the enhanced detection
-                            import signal
-                            
-                            def timeout_handler(signum, frame):
-                                raise TimeoutError("Enhanced detection timed out")
-                            
-                            # Only on non-Windows systems
-                            if hasattr(signal, 'SIGALRM'):
-                                signal.signal(signal.SIGALRM, timeout_handler)
-                                signal.alarm(3)  # 3 second timeout
-                            
-                            try:
-                                assignee_result = enhanced_team_tracker.get_assignee_for_card(card.id)
-                                if assignee_result:
-                                    assigned_user = assignee_result['name']
-                                    assigned_whatsapp = assignee_result['whatsapp']
-                                    print(f"FOUND: Enhanced tracker detected assignee: {assigned_user}")
-                            finally:
-                                if hasattr(signal, 'SIGALRM'):
-                                    signal.alarm(0)  # Cancel the alarm
-                                    
-                        except TimeoutError:
-                            print(f"  ENHANCED DETECTION: Timed out after 3 seconds")
-                        except Exception as e:
-                            print(f"  ENHANCED DETECTION: Error: {e}")
-
-                    # Method 3: Check comments for assignment mentions (recent comments only)
-                    if not assigned_user:
-                        try:
-                            print(f"  COMMENT ASSIGNMENT: Checking recent comments for assignments...")
-                            api_key = os.environ.get('TRELLO_API_KEY')
-                            token = os.environ.get('TRELLO_TOKEN')
-                            
-                            if api_key and token:
-                                comments_url = f"https://api.trello.com/1/cards/{card.id}/actions"
-                                params = {
-                                    'filter': 'commentCard',
-                                    'limit': 10,  # Recent comments only
-                                    'key': api_key,
-                                    'token': token
-                                }
-                                response = requests.get(comments_url, params=params)
-                                if response.status_code == 200:
-                                    recent_comments = response.json()
-                                    for comment in recent_comments[:5]:  # Check last 5 comments
-                                        comment_text = comment.get('data', {}).get('text', '').lower()
-                                        commenter = comment.get('memberCreator', {}).get('fullName', '').lower()
-                                        
-                                        # Look for assignment patterns in comments
-                                        for team_member_name, whatsapp_num in current_team_members.items():
-                                            member_lower = team_member_name.lower()
-                                            
-                                            if member_lower in ['admin', 'criselle']:
-                                                continue
-                                            
-                                            assignment_patterns = [
-                                                f"@{member_lower}",
-                                                f"assign this to {member_lower}",
-                                                f"assigned to {member_lower}",
-                                                f"{member_lower} please",
-                                                f"{member_lower} can you",
-                                                f"{member_lower} take this",
-                                                f"{member_lower} handle this",
-                                            ]
-                                            
-                                            for pattern in assignment_patterns:
-                                                if pattern in comment_text:
-                                                    assigned_user = team_member_name
-                                                    assigned_whatsapp = whatsapp_num
-                                                    print(f"FOUND: Assignment in comment '{pattern}': {team_member_name}")
-                                                    break
-                                            
-                                            if assigned_user:
-                                                break
-                                    
-                                        if assigned_user:
-                                            break
-                                        
-                        except Exception as e:
-                            print(f"  COMMENT ASSIGNMENT: Could not check comments: {e}")
+                    log.debug("SEARCH: Looking for assigned user for card: %s", card.name)
                     
-                    # Method 4: Smart defaults based on card content/type
-                    if not assigned_user:
-                        print(f"  SMART DEFAULTS: Attempting to assign based on card content...")
-                        card_content = f"{card.name.lower()} {card_description}".lower()
-                        
-                        # Content-based assignments (only if team members exist in current team)
-                        if any(keyword in card_content for keyword in ['mobile', 'app', 'ios', 'android']):
-                            if 'Wendy' in current_team_members:
-                                assigned_user = 'Wendy'
-                                assigned_whatsapp = current_team_members.get('Wendy')
-                                print(f"FOUND: Mobile/App content assigned to Wendy")
-                        elif any(keyword in card_content for keyword in ['website', 'web', 'wordpress', 'landing', 'page']):
-                            if 'Lancey' in current_team_members:
-                                assigned_user = 'Lancey'
-                                assigned_whatsapp = current_team_members.get('Lancey')
-                                print(f"FOUND: Website content assigned to Lancey")
-                        elif any(keyword in card_content for keyword in ['design', 'logo', 'brand', 'graphics']):
-                            if 'Breyden' in current_team_members:
-                                assigned_user = 'Breyden'
-                                assigned_whatsapp = current_team_members.get('Breyden')
-                                print(f"FOUND: Design content assigned to Breyden")
-                        elif any(keyword in card_content for keyword in ['automation', 'integration', 'api', 'webhook']):
-                            # Skip Ezechiel as he's been removed from team
-                            print(f"SKIP: Automation content (Ezechiel no longer in team)")
+                    # Enhanced detection makes its own API calls, so only use it on smaller
+                    # boards (to prevent timeouts) and for actively tracked cards
+                    assigned_user, assigned_whatsapp = resolve_card_assignee(
+                        card, prefetched_comments.get(card.id), current_team_members,
+                        team_members_lower, assignable_members,
+                        use_enhanced_detection=bool(enhanced_team_tracker) and total_cards < 30 and card_needs_tracking)
                     
                     # Check if we found an assigned user
                     if not assigned_user:
-                        print(f"ERROR: No assigned user found for card: {card.name}")
-                        print(f"   Available team members: {list(current_team_members.keys())}")
+                        log.debug("ERROR: No assigned user found for card: %s", card.name)
+                        log.debug("   Available team members: %s", list(current_team_members.keys()))
                         continue
                     else:
-                        print(f"SUCCESS: Assigned user found: {assigned_user} -> {assigned_whatsapp}")
+                        log.debug("SUCCESS: Assigned user found: %s -> %s", assigned_user, assigned_whatsapp)
                     
                 except Exception as e:
-                    print(f"ERROR: Failed to detect assigned user for card {card.name}: {e}")
+                    log.warning("ERROR: Failed to detect assigned user for card %s: %s", card.name, e)
                     # Continue with no assigned user
                 
                 # AI-powered analysis to determine if assigned user has provided updates
@@ -3203,108 +3936,75 @@ def scan_cards():
                 
                 if assigned_user:
                     try:
-                        print(f"AI ANALYSIS: Checking if {assigned_user} has provided updates...")
+                        log.debug("AI ANALYSIS: Checking if %s has provided updates...", assigned_user)
                         
                         # Get comments from the card using different methods
-                        card_comments = []
-                        try:
-                            # Try to get comments via API
-                            import requests
-                            api_key = os.environ.get('TRELLO_API_KEY')
-                            token = os.environ.get('TRELLO_TOKEN')
-                            
-                            if api_key and token:
-                                comments_url = f"https://api.trello.com/1/cards/{card.id}/actions"
-                                params = {
-                                    'filter': 'commentCard',
-                                    'limit': 50,
-                                    'key': api_key,
-                                    'token': token
-                                }
-                                response = requests.get(comments_url, params=params)
-                                if response.status_code == 200:
-                                    card_comments = response.json()
-                                    print(f"  API: Retrieved {len(card_comments)} comments")
-                        except Exception as e:
-                            print(f"  API: Could not fetch comments via API: {e}")
+                        card_comments = prefetched_comments.get(card.id) or []
+                        if card_comments:
+                            log.debug("  API: Retrieved %s comments", len(card_comments))
                         
                         # Analyze comments using AI
                         if card_comments:
-                            # Filter comments by assigned user
-                            assigned_user_comments = []
-                            admin_comments = []
-                            other_comments = []
+                            # Count comments by author and keep only the assigned user's most
+                            # recent one as (hours_ago, text); the other comments are just counted
+                            most_recent = None
+                            assigned_count = admin_count = other_count = 0
                             
-                            from datetime import datetime, timedelta
-                            now = datetime.now()
+                            assigned_user_lower = assigned_user.lower()
                             
                             for comment in card_comments:
                                 commenter_name = comment.get('memberCreator', {}).get('fullName', '').lower()
-                                comment_text = comment.get('data', {}).get('text', '')
-                                comment_date = comment.get('date', '')
+                                
+                                if assigned_user_lower in commenter_name:
+                                    assigned_count += 1
+                                elif 'admin' in commenter_name or 'criselle' in commenter_name:
+                                    admin_count += 1
+                                    continue
+                                else:
+                                    other_count += 1
+                                    continue
                                 
                                 # Parse comment date
                                 try:
-                                    comment_datetime = datetime.fromisoformat(comment_date.replace('Z', '+00:00'))
-                                    hours_ago = (now.replace(tzinfo=comment_datetime.tzinfo) - comment_datetime).total_seconds() / 3600
+                                    comment_datetime = datetime.fromisoformat(comment.get('date', ''))
+                                    hours_ago = (now_utc - comment_datetime).total_seconds() / 3600
                                 except:
                                     hours_ago = 999
                                 
-                                if assigned_user.lower() in commenter_name:
-                                    assigned_user_comments.append({
-                                        'text': comment_text,
-                                        'hours_ago': hours_ago,
-                                        'date': comment_date
-                                    })
-                                elif 'admin' in commenter_name or 'criselle' in commenter_name:
-                                    admin_comments.append({
-                                        'text': comment_text,
-                                        'hours_ago': hours_ago,
-                                        'date': comment_date
-                                    })
-                                else:
-                                    other_comments.append({
-                                        'text': comment_text,
-                                        'hours_ago': hours_ago,
-                                        'commenter': commenter_name
-                                    })
+                                if most_recent is None or hours_ago < most_recent[0]:
+                                    most_recent = (hours_ago, comment.get('data', {}).get('text', ''))
                             
-                            print(f"  COMMENTS: {assigned_user}: {len(assigned_user_comments)}, Admin: {len(admin_comments)}, Others: {len(other_comments)}")
+                            log.debug("  COMMENTS: %s: %s, Admin: %s, Others: %s", assigned_user, assigned_count, admin_count, other_count)
                             
                             # Use simple AI logic to determine if update is needed
-                            if assigned_user_comments:
-                                # Find most recent comment from assigned user
-                                most_recent = min(assigned_user_comments, key=lambda x: x['hours_ago'])
-                                assigned_user_last_update_hours = most_recent['hours_ago']
+                            if most_recent:
+                                assigned_user_last_update_hours, recent_comment_text = most_recent
                                 
                                 # Simple AI analysis: Check if the comment contains meaningful update content
-                                recent_comment_text = most_recent['text'].lower()
-                                update_keywords = ['progress', 'completed', 'working on', 'finished', 'done', 'update', 'status', 'started', 'implementing', 'fixed', 'issue', 'blocker', 'challenge', 'estimate', 'timeline', 'percentage', '%']
-                                
-                                has_meaningful_update = any(keyword in recent_comment_text for keyword in update_keywords)
+                                has_meaningful_update = bool(_UPDATE_KEYWORDS_RE.search(recent_comment_text))
                                 
                                 if assigned_user_last_update_hours < 24 and has_meaningful_update:
                                     needs_update = False
-                                    print(f"  AI: {assigned_user} provided meaningful update {assigned_user_last_update_hours:.1f}h ago - NO UPDATE NEEDED")
+                                    log.debug("  AI: %s provided meaningful update %.1fh ago - NO UPDATE NEEDED", assigned_user, assigned_user_last_update_hours)
                                 elif assigned_user_last_update_hours < 24 and len(recent_comment_text) > 20:
                                     needs_update = False  # Any substantial comment counts
-                                    print(f"  AI: {assigned_user} provided substantial comment {assigned_user_last_update_hours:.1f}h ago - NO UPDATE NEEDED")
+                                    log.debug("  AI: %s provided substantial comment %.1fh ago - NO UPDATE NEEDED", assigned_user, assigned_user_last_update_hours)
                                 else:
                                     needs_update = True
-                                    print(f"  AI: {assigned_user} last update {assigned_user_last_update_hours:.1f}h ago - NEEDS UPDATE")
+                                    log.debug("  AI: %s last update %.1fh ago - NEEDS UPDATE", assigned_user, assigned_user_last_update_hours)
                             else:
-                                print(f"  AI: {assigned_user} has NO comments - NEEDS UPDATE")
+                                log.debug("  AI: %s has NO comments - NEEDS UPDATE", assigned_user)
                                 needs_update = True
                                 # Keep as None if no comments found
                     
                     except Exception as e:
-                        print(f"AI ANALYSIS ERROR for {card.name}: {e}")
+                        log.warning("AI ANALYSIS ERROR for %s: %s", card.name, e)
                         needs_update = True  # Default to needs update on error
                 
                 card_data = {
                     'id': card.id,
                     'name': card.name,
-                    'description': card.description[:200] if card.description else '',
+                    'description': (card.description or '')[:200],
                     'url': card.url,
                     'board_name': eeinteractive_board.name,
                     'list_name': list_names.get(card.list_id, 'Unknown'),
@@ -3325,7 +4025,7 @@ def scan_cards():
                 # Update database with fresh card data
                 if enhanced_team_tracker and enhanced_team_tracker.db and assigned_user:
                     try:
-                        print(f"  DB UPDATE: Storing card {card.name} -> {assigned_user}")
+                        log.debug("  DB UPDATE: Storing card %s -> %s", card.name, assigned_user)
                         # Use the enhanced tracker's method which handles comment dates correctly
                         enhanced_team_tracker.update_card_tracking(
                             card_id=card.id,
@@ -3333,11 +4033,10 @@ def scan_cards():
                             assignee_name=assigned_user,
                             assignee_phone=assigned_whatsapp or ''
                         )
-                        print(f"  DB UPDATE: Successfully stored card {card.id}")
+                        log.debug("  DB UPDATE: Successfully stored card %s", card.id)
                     except Exception as e:
-                        print(f"  DB UPDATE ERROR: Could not update card {card.id}: {e}")
-                        import traceback
-                        print(f"  DB UPDATE TRACEBACK: {traceback.format_exc()}")
+                        log.warning("  DB UPDATE ERROR: Could not update card %s: %s", card.id, e)
+                        log.debug("  DB UPDATE TRACEBACK:", exc_info=True)
                 
                 # Add to cards needing updates - but we'll filter with enhanced logic later
                 if needs_update:
@@ -3346,15 +4045,15 @@ def scan_cards():
                     cards_needing_updates.append(card_data)
                     
             except Exception as e:
-                print(f"ERROR: Failed to process card {card.name if hasattr(card, 'name') else 'unknown'}: {e}")
+                log.warning("ERROR: Failed to process card %s: %s", card.name if hasattr(card, 'name') else 'unknown', e)
                 continue  # Skip this card and continue with others
         
-        print(f"[ENHANCED] Found {len(cards_needing_updates)} cards with potential updates needed")
+        log.info("[ENHANCED] Found %s cards with potential updates needed", len(cards_needing_updates))
         
         # Use enhanced team tracker to filter cards that actually need messages
         final_cards_needing_updates = enhanced_team_tracker.get_cards_needing_messages(cards_needing_updates)
         
-        print(f"[ENHANCED] After enhanced filtering: {len(final_cards_needing_updates)} cards need messages")
+        log.info("[ENHANCED] After enhanced filtering: %s cards need messages", len(final_cards_needing_updates))
         
         # Clean up any remaining card objects from the original cards_needing_updates
         # (The enhanced tracker should have cleaned them, but let's be safe)
@@ -3362,16 +4061,19 @@ def scan_cards():
             if 'card' in card:
                 del card['card']
         
-        # Sort by hours since assigned user update (most urgent first)
-        all_cards.sort(key=lambda x: x.get('hours_since_assigned_update', 0) or 0, reverse=True)
-        final_cards_needing_updates.sort(key=lambda x: x.get('hours_since_assigned_update', 0) or 0, reverse=True)
+        # Sort by hours since assigned user update (most urgent first); every card dict
+        # built above carries the field as a number, so a C-level itemgetter is the key
+        by_update_hours = itemgetter('hours_since_assigned_update')
+        all_cards.sort(key=by_update_hours, reverse=True)
+        final_cards_needing_updates.sort(key=by_update_hours, reverse=True)
         
         # Store in app_data for other endpoints
-        app_data['all_cards'] = all_cards
-        app_data['cards_needing_updates'] = final_cards_needing_updates  # Use enhanced filtered results
+        with _app_data_lock:
+            app_data['all_cards'] = all_cards
+            app_data['cards_needing_updates'] = final_cards_needing_updates  # Use enhanced filtered results
         
         processing_time = time.time() - start_time
-        print(f"Scanned {len(all_cards)} cards from EEInteractive board in {processing_time:.2f}s")
+        log.info("Scanned %s cards from EEInteractive board in %.2fs", len(all_cards), processing_time)
         
         return jsonify({
             'success': True,
@@ -3381,7 +4083,7 @@ def scan_cards():
         })
         
     except Exception as e:
-        print(f"Error scanning cards: {e}")
+        log.error("Error scanning cards: %s", e)
         return jsonify({'success': False, 'error': str(e)})
 
 @app.route('/api/preview-updates', methods=['POST'])
@@ -3395,8 +4097,9 @@ def preview_updates():
             return jsonify({'success': False, 'error': 'No cards selected'})
         
         # Get cards from app_data (check both sources)
-        all_cards = app_data.get('all_cards', [])
-        cards_needing_updates = app_data.get('cards_needing_updates', [])
+        with _app_data_lock:
+            all_cards = get_cards_snapshot('all_cards')
+            cards_needing_updates = get_cards_snapshot()
         
         # Use cards_needing_updates first, fall back to all_cards
         available_cards = cards_needing_updates if cards_needing_updates else all_cards
@@ -3406,20 +4109,18 @@ def preview_updates():
         
         print(f"PREVIEW: Looking for {len(selected_card_ids)} selected cards in {len(available_cards)} available cards")
         
+        # Index the cards by id once (reversed so the first card with an id wins)
+        cards_by_id = {card['id']: card for card in reversed(available_cards)}
+        
         # Group cards by assigned user
         user_cards = {}
         
         for card_id in selected_card_ids:
             # Find the card in our data
-            card_data = None
-            for card in available_cards:
-                if card['id'] == card_id:
-                    card_data = card
-                    print(f"PREVIEW: Found card {card['name']} assigned to {card.get('assigned_user')}")
-                    break
-            
+            card_data = cards_by_id.get(card_id)
             if not card_data:
                 continue
+            print(f"PREVIEW: Found card {card_data['name']} assigned to {card_data.get('assigned_user')}")
             
             assigned_user = card_data.get('assigned_user')
             assigned_whatsapp = card_data.get('assigned_whatsapp')
@@ -3427,14 +4128,15 @@ def preview_updates():
             if not assigned_user or not assigned_whatsapp:
                 continue
             
-            if assigned_user not in user_cards:
-                user_cards[assigned_user] = {
+            user_entry = user_cards.get(assigned_user)
+            if user_entry is None:
+                user_entry = user_cards[assigned_user] = {
                     'assigned_user': assigned_user,
                     'assigned_whatsapp': assigned_whatsapp,
                     'cards': []
                 }
             
-            user_cards[assigned_user]['cards'].append({
+            user_entry['cards'].append({
                 'id': card_data['id'],
                 'name': card_data['name'],
                 'url': card_data['url'],
@@ -3448,6 +4150,8 @@ def preview_updates():
         # Generate combined messages for each user
         previews = []
         escalated_cards = []  # Track cards that need group escalation
+        # Read the reminder tracking file once for every card's status lookup
+        reminder_tracking = load_reminder_tracking()
         
         for assigned_user, user_data in user_cards.items():
             cards = user_data['cards']
@@ -3458,7 +4162,7 @@ def preview_updates():
             regular_cards = []
             
             for card in cards:
-                reminder_status = get_reminder_status(card['id'], assigned_user)
+                reminder_status = reminder_status_from(reminder_tracking, card['id'], assigned_user)
                 card['reminder_count'] = reminder_status['reminder_count']
                 card['is_escalated'] = reminder_status['escalated']
                 
@@ -3476,12 +4180,12 @@ def preview_updates():
             
             # Only create preview for regular (non-escalated) cards
             if regular_cards:
-                # Create combined message for regular cards
-                message = f"""Hey {assigned_user}, these are cards that need an update as over 24 hours have passed. If its ongoing just comment that and what has been done in the last 24 hours. You will be reminded 3 times about this and if no comment is made then it will be posted in the main group.
+                # Create combined message for regular cards, built from parts and joined once
+                message_parts = [f"""Hey {assigned_user}, these are cards that need an update as over 24 hours have passed. If its ongoing just comment that and what has been done in the last 24 hours. You will be reminded 3 times about this and if no comment is made then it will be posted in the main group.
 
 📋 Cards requiring updates ({len(regular_cards)}):
 
-"""
+"""]
                 
                 for i, card in enumerate(regular_cards, 1):
                     hours = card['hours_since_update']
@@ -3497,11 +4201,12 @@ def preview_updates():
                     days = int(hours / 24)
                     reminder_text = f" (Reminder #{reminder_count + 1})" if reminder_count > 0 else ""
                     
-                    message += f"{urgency_icon} {i}. *{card['name']}*{reminder_text}\n"
-                    message += f"   ⏰ {days} days without update\n"
-                    message += f"   🔗 {card['url']}\n\n"
+                    message_parts.append(f"{urgency_icon} {i}. *{card['name']}*{reminder_text}\n"
+                                         f"   ⏰ {days} days without update\n"
+                                         f"   🔗 {card['url']}\n\n")
                 
-                message += "Please update these cards with your current progress. Thanks! 🚀\n\n- JGV EEsystems Team Tracker"
+                message_parts.append("Please update these cards with your current progress. Thanks! 🚀\n\n- JGV EEsystems Team Tracker")
+                message = ''.join(message_parts)
                 
                 preview_data = {
                     'assigned_user': assigned_user,
@@ -3517,28 +4222,26 @@ def preview_updates():
         
         # Add escalation message if there are escalated cards
         if escalated_cards:
-            escalation_message = """🚨 URGENT: Cards Requiring Immediate Attention 🚨
+            escalation_parts = ["""🚨 URGENT: Cards Requiring Immediate Attention 🚨
 
 The following team members have not responded to 3+ reminders about their assigned cards. These cards need immediate updates:
 
-"""
+"""]
             
             # Group escalated cards by user
-            escalated_by_user = {}
+            escalated_by_user = defaultdict(list)
             for card in escalated_cards:
-                user = card['assigned_user']
-                if user not in escalated_by_user:
-                    escalated_by_user[user] = []
-                escalated_by_user[user].append(card)
+                escalated_by_user[card['assigned_user']].append(card)
             
             for user, user_escalated_cards in escalated_by_user.items():
-                escalation_message += f"\n👤 *{user}* ({len(user_escalated_cards)} cards):\n"
+                escalation_parts.append(f"\n👤 *{user}* ({len(user_escalated_cards)} cards):\n")
                 for card in user_escalated_cards:
                     days = int(card['hours_since_update'] / 24)
-                    escalation_message += f"   🔴 {card['card_name']} ({days} days, {card['reminder_count']} reminders)\n"
-                    escalation_message += f"       🔗 {card['card_url']}\n"
+                    escalation_parts.append(f"   🔴 {card['card_name']} ({days} days, {card['reminder_count']} reminders)\n"
+                                            f"       🔗 {card['card_url']}\n")
             
-            escalation_message += "\n⚠️ Please follow up with these team members immediately or reassign these cards.\n\n- JGV EEsystems Team Tracker (AUTO-ESCALATION)"
+            escalation_parts.append("\n⚠️ Please follow up with these team members immediately or reassign these cards.\n\n- JGV EEsystems Team Tracker (AUTO-ESCALATION)")
+            escalation_message = ''.join(escalation_parts)
             
             # Add escalation preview (this would go to group/admin)
             previews.append({
@@ -3579,10 +4282,33 @@ def send_whatsapp_updates():
         if not green_api_instance or not green_api_token:
             return jsonify({'success': False, 'error': 'Green API credentials not configured'})
         
+        green_api_url = f"https://api.green-api.com/waInstance{green_api_instance}/sendMessage/{green_api_token}"
+        
+        def post_preview(preview):
+            """Send one preview's message; returns (response, error), or (None, None) if it can't be sent."""
+            whatsapp_number = preview.get('assigned_whatsapp')
+            message = preview.get('message')
+            if not whatsapp_number or not message:
+                return None, None
+            
+            payload = {
+                "chatId": whatsapp_number,
+                "message": message
+            }
+            try:
+                return _http.post(green_api_url, json=payload, timeout=30), None
+            except Exception as send_error:
+                return None, send_error
+        
+        # Each message is an independent Green API round-trip over the pooled session,
+        # so send them concurrently; results are recorded here, in preview order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            send_results = list(executor.map(post_preview, previews))
+        
         sent_messages = []
         failed_messages = []
         
-        for preview in previews:
+        for preview, (response, send_error) in zip(previews, send_results):
             assigned_user = preview.get('assigned_user')
             whatsapp_number = preview.get('assigned_whatsapp')
             message = preview.get('message')
@@ -3594,19 +4320,17 @@ def send_whatsapp_updates():
                 })
                 continue
             
+            if send_error is not None:
+                failed_messages.append({
+                    'user': assigned_user,
+                    'error': f"Network error: {str(send_error)}"
+                })
+                print(f"Error sending to {assigned_user}: {send_error}")
+                continue
+            
             try:
-                # Send message via Green API
-                green_api_url = f"https://api.green-api.com/waInstance{green_api_instance}/sendMessage/{green_api_token}"
-                
-                payload = {
-                    "chatId": whatsapp_number,
-                    "message": message
-                }
-                
-                response = requests.post(green_api_url, json=payload, timeout=30)
-                
                 if response.status_code == 200:
-                    result = response.json()
+                    result = json_loads(response.content)
                     
                     # Increment reminder count for each card in this message
                     if preview.get('message_type') == 'regular':
@@ -3678,16 +4402,15 @@ def send_participant_feedback():
         # Send feedback messages
         messages_sent = []
         failed_messages = []
+        # Lowercase team names once, not once per participant
+        team_members_lower = [(team_member.lower(), phone_number) for team_member, phone_number in TEAM_MEMBERS.items()]
         
         for participant, feedback_data in participant_feedback.items():
             # Find participant's WhatsApp number
-            whatsapp_number = None
             participant_lower = participant.lower()
-            
-            for team_member, phone_number in TEAM_MEMBERS.items():
-                if team_member.lower() in participant_lower or participant_lower in team_member.lower():
-                    whatsapp_number = phone_number
-                    break
+            whatsapp_number = next((phone_number for team_member_lower, phone_number in team_members_lower
+                                    if team_member_lower in participant_lower or participant_lower in team_member_lower),
+                                   None)
             
             if not whatsapp_number:
                 failed_messages.append({
@@ -3701,7 +4424,7 @@ def send_participant_feedback():
             
             # Send WhatsApp message
             try:
-                whatsapp_response = requests.post(
+                whatsapp_response = _http.post(
                     WHATSAPP_API_URL,
                     headers={'Authorization': f'Bearer {GREEN_API_TOKEN}'},
                     json={
@@ -3825,21 +4548,16 @@ def send_updates():
             return jsonify({'success': False, 'error': 'Trello client not available'})
         
         # Get EEInteractive board and current cards (reuse scan logic)
-        boards = trello_client.list_boards()
-        eeinteractive_board = None
-        
-        for board in boards:
-            if board.closed:
-                continue
-            if 'eeinteractive' in board.name.lower():
-                eeinteractive_board = board
-                break
+        eeinteractive_board = _get_fresh_eeinteractive_board()
         
         if not eeinteractive_board:
             return jsonify({'success': False, 'error': 'EEInteractive board not found'})
         
         # Get board cards and find selected ones
         board_cards = eeinteractive_board.list_cards()
+        if not board_cards:
+            invalidate_trello_cache()
+        selected_card_ids = set(selected_card_ids)
         selected_cards = [card for card in board_cards if card.id in selected_card_ids]
         
         if not selected_cards:
@@ -3848,6 +4566,11 @@ def send_updates():
         # Use global TEAM_MEMBERS instead of hardcoded duplicate
         # (Removed hardcoded dictionary that was causing inconsistencies)
         
+        # Fetch every selected card's comments up front rather than one request per
+        # card inside the loop (the newest 50, newest first)
+        prefetched_comments = get_card_comments_batch(
+            (card.id for card in selected_cards), board_id=eeinteractive_board.id)
+        
         sent_messages = []
         failed_messages = []
         
@@ -3884,30 +4607,20 @@ def send_updates():
                 # Method 2: Check card comments for assignments (like scan_cards does)
                 if not assigned_user:
                     try:
-                        comments_url = f"https://api.trello.com/1/cards/{card.id}/actions"
-                        params = {
-                            'key': trello_client.api_key,
-                            'token': trello_client.token,
-                            'filter': 'commentCard',
-                            'limit': 50
-                        }
-                        comments_response = requests.get(comments_url, params=params, timeout=10)
+                        comments = prefetched_comments.get(card.id) or []
                         
-                        if comments_response.status_code == 200:
-                            comments = comments_response.json()
+                        # Look for assignments in recent comments
+                        for comment in comments[:10]:  # Check last 10 comments
+                            comment_text = comment.get('data', {}).get('text', '').lower()
                             
-                            # Look for assignments in recent comments
-                            for comment in comments[:10]:  # Check last 10 comments
-                                comment_text = comment.get('data', {}).get('text', '').lower()
-                                
-                                for pattern, member in assignment_patterns:
-                                    if re.search(pattern, comment_text):
-                                        assigned_user = member
-                                        assigned_whatsapp = TEAM_MEMBERS[member]
-                                        break
-                                
-                                if assigned_user:
+                            for pattern, member in assignment_patterns:
+                                if re.search(pattern, comment_text):
+                                    assigned_user = member
+                                    assigned_whatsapp = TEAM_MEMBERS[member]
                                     break
+                            
+                            if assigned_user:
+                                break
                     except Exception as e:
                         print(f"Error checking comments for card {card.name}: {e}")
                 
@@ -3940,7 +4653,7 @@ Thanks! 🙏"""
                     "message": message
                 }
                 
-                response = requests.post(api_url, json=payload, timeout=10)
+                response = _http.post(api_url, json=payload, timeout=10)
                 
                 if response.status_code == 200:
                     sent_messages.append({
@@ -4052,11 +4765,11 @@ def check_card_comments():
             'limit': 50
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http.get(url, params=params, timeout=10)
         if response.status_code != 200:
             return jsonify({'success': False, 'error': f'Trello API error: {response.status_code}'})
         
-        comments = response.json()
+        comments = json_loads(response.content)
         
         # Check for recent comments (within last 24 hours)
         now = datetime.now()
@@ -4324,7 +5037,7 @@ Reply with your current status or any blockers you're facing.
                     "message": message_text
                 }
                 
-                response = requests.post(api_url, json=payload, timeout=10)
+                response = _http.post(api_url, json=payload, timeout=10)
                 
                 if response.status_code == 200:
                     # Log the message in tracker
@@ -4792,16 +5505,15 @@ def save_team_tracker_settings():
         db = production_db or get_production_db()
         if db:
             db.init_settings_table()
-            import json
             
             # Save each setting
-            db.save_setting('escalation_intervals', json.dumps(escalation_intervals), 'json')
+            db.save_setting('escalation_intervals', json_dumps(escalation_intervals), 'json')
             db.save_setting('enable_escalation', str(settings.get('enable_escalation', True)).lower(), 'bool')
             db.save_setting('enable_group_messages', str(settings.get('enable_group_messages', True)).lower(), 'bool')
             db.save_setting('enable_individual_messages', str(settings.get('enable_individual_messages', True)).lower(), 'bool')
             db.save_setting('working_hours_start', settings.get('working_hours_start', '09:00'), 'string')
             db.save_setting('working_hours_end', settings.get('working_hours_end', '17:00'), 'string')
-            db.save_setting('working_days', json.dumps(settings.get('working_days', ['monday', 'tuesday', 'wednesday', 'thursday', 'friday'])), 'json')
+            db.save_setting('working_days', json_dumps(settings.get('working_days', ['monday', 'tuesday', 'wednesday', 'thursday', 'friday'])), 'json')
             
             print(f"SETTINGS SAVE: Saved team tracker settings to database")
         else: